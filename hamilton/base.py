@@ -62,6 +62,12 @@ class DictResult(ResultMixin):
         """This function builds a simple dict of output -> computed values."""
         return outputs
 
+    @staticmethod
+    def build_result_from_dict(outputs: Dict[str, Any]) -> Dict:
+        """The outputs are already a dict of output -> computed values. Copies them, as the
+        original dict is also passed to (and possibly held onto by) graph execution hooks."""
+        return dict(outputs)
+
     def input_types(self) -> Optional[List[Type[Type]]]:
         return [Any]
 
@@ -200,6 +206,14 @@ class PandasDataFrameResult(ResultMixin):
         This function will check the index types of the outputs, and log warnings if they don't match.
         The behavior of pd.Dataframe(outputs) is that it will do an outer join based on indexes of the Series passed in.
 
+        :param outputs: the outputs to build a dataframe from.
+        """
+        return PandasDataFrameResult.build_result_from_dict(outputs)
+
+    @staticmethod
+    def build_result_from_dict(outputs: Dict[str, Any]) -> pd.DataFrame:
+        """Builds a Pandas DataFrame from the outputs. See `build_result`.
+
         :param outputs: the outputs to build a dataframe from.
         """
         # TODO check inputs are pd.Series, arrays, or scalars -- else error
@@ -402,6 +416,9 @@ class SimplePythonDataFrameGraphAdapter(HamiltonGraphAdapter, PandasDataFrameRes
     pandas dataframe as output.
     """
 
+    # htypes.check_input_type only looks at the type of the value
+    input_validation_cacheable = True
+
     @staticmethod
     def check_input_type(node_type: Type, input_value: Any) -> bool:
         return htypes.check_input_type(node_type, input_value)
@@ -438,6 +455,12 @@ class SimplePythonGraphAdapter(SimplePythonDataFrameGraphAdapter):
         """Delegates to the result builder function supplied."""
         return self.result_builder.build_result(**outputs)
 
+    def build_result_from_dict(self, outputs: Dict[str, Any]) -> Any:
+        """Delegates to the result builder supplied, without unpacking the outputs if it can."""
+        if isinstance(self.result_builder, lifecycle_api.ResultBuilder):
+            return self.result_builder.do_build_result(outputs=outputs)
+        return self.result_builder.build_result(**outputs)
+
     def output_type(self) -> Type:
         return self.result_builder.output_type()
 
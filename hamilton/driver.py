@@ -3,16 +3,21 @@ import functools
 import json
 import logging
 import operator
+import os
 import sys
+import threading
 import time
 
 # required if we want to run this code stand alone.
 import typing
 import uuid
+import warnings
+import weakref
 from collections.abc import Sequence  # typing.Sequence is deprecated in >=3.9
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from types import ModuleType
-from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Collection, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 import pandas as pd
 
@@ -30,6 +35,11 @@ SLACK_ERROR_MESSAGE = (
     "-------------------------------------------------------------------\n"
 )
 
+DISPLAY_GRAPH_DEPRECATION_MESSAGE = (
+    "display_graph=True is deprecated. It will be removed in the 2.0.0 release. "
+    "Please use visualize_execution()."
+)
+
 if __name__ == "__main__":
     import base
     import graph
@@ -40,6 +50,59 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for inputs that were not passed at all (as opposed to passed as None)
+_MISSING = object()
+
+
+def _input_validation_is_cacheable(validating_adapter: Any) -> bool:
+    """Whether an adapter's input validation only depends on the type of the input.
+
+    The `input_validation_cacheable` flag is inherited, so we only trust it if the class has not
+    overridden the validation of the class that set it -- a subclass might check the value.
+    """
+    cls = type(validating_adapter)
+    for declaring_cls in cls.__mro__:
+        if "input_validation_cacheable" in vars(declaring_cls):
+            break
+    else:
+        return False
+    if not declaring_cls.input_validation_cacheable:
+        return False
+    return all(
+        getattr(cls, method_name, None) is getattr(declaring_cls, method_name, None)
+        for method_name in ("do_validate_input", "check_input_type")
+    )
+
+
+def _get_type_check(
+    type_check_cache: Optional[Dict[Tuple[Any, type], bool]], key: Tuple[Any, type]
+) -> Optional[bool]:
+    """Looks up a cached input type check. Returns None if there is no cache/entry."""
+    if type_check_cache is None:
+        return None
+    try:
+        return type_check_cache.get(key)
+    except TypeError:  # unhashable node type, E.G. Annotated with unhashable metadata
+        return None
+
+
+def _set_type_check(
+    type_check_cache: Optional[Dict[Tuple[Any, type], bool]], key: Tuple[Any, type], result: bool
+):
+    """Caches an input type check, if there is a cache and the key is hashable."""
+    if type_check_cache is None:
+        return
+    try:
+        type_check_cache[key] = result
+    except TypeError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_display_graph_deprecated():
+    """Warns about display_graph being deprecated. Cached, so this only warns once per process."""
+    warnings.warn(DISPLAY_GRAPH_DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=3)
+
 
 def capture_function_usage(call_fn: Callable) -> Callable:
     """Decorator to wrap some driver functions for telemetry capture.
@@ -119,6 +182,23 @@ class GraphExecutor(abc.ABC):
         pass
 
 
+def _select_outputs(
+    final_vars: List[str], computed: Dict[str, Any], inputs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Picks the requested variables out of the computed ones, falling back to the inputs.
+
+    Almost every request is for one or two outputs, so those are special-cased -- this is called
+    once per execute, and building the dict directly avoids the comprehension's overhead.
+    """
+    if len(final_vars) == 1:
+        (a,) = final_vars
+        return {a: computed.get(a, inputs.get(a))}
+    if len(final_vars) == 2:
+        a, b = final_vars
+        return {a: computed.get(a, inputs.get(a)), b: computed.get(b, inputs.get(b))}
+    return {final_var: computed.get(final_var, inputs.get(final_var)) for final_var in final_vars}
+
+
 class DefaultGraphExecutor(GraphExecutor):
     DEFAULT_TASK_NAME = "root"  # Not task-based, so we just assign a default name for a task
 
@@ -156,16 +236,187 @@ class DefaultGraphExecutor(GraphExecutor):
         memoized_computation = dict()  # memoized storage
         nodes = [fg.nodes[node_name] for node_name in final_vars if node_name in fg.nodes]
         fg.execute(nodes, memoized_computation, overrides, inputs, run_id=run_id)
-        outputs = {
-            # we do this here to enable inputs to also be used as outputs
-            # putting inputs into memoized before execution doesn't work due to some graphadapter assumptions.
-            final_var: memoized_computation.get(final_var, inputs.get(final_var))
-            for final_var in final_vars
-        }  # only want request variables in df.
+        # we do this here to enable inputs to also be used as outputs
+        # putting inputs into memoized before execution doesn't work due to some graphadapter assumptions.
+        outputs = _select_outputs(final_vars, memoized_computation, inputs)
         del memoized_computation  # trying to cleanup some memory
         return outputs
 
 
+class ParallelGraphExecutor(DefaultGraphExecutor):
+    PGO_SMOOTHING = 0.1  # Weight of the latest timing in the moving average of node timings
+
+    def __init__(
+        self,
+        adapter: Optional[lifecycle_base.LifecycleAdapterSet] = None,
+        max_workers: Optional[int] = None,
+        cost_fn: Optional[Callable[[node.Node], float]] = None,
+        pgo: bool = False,
+        pgo_interval: int = 10,
+    ):
+        """Graph executor that runs independent nodes concurrently on a thread pool.
+        Nodes are submitted as soon as all of their dependencies have been computed, so wide DAGs
+        (E.G. independent IO/pandas-bound branches, which release the GIL) keep all workers busy.
+        When more nodes are ready than there are workers, the ones on the critical path
+        (the most expensive chain to the requested outputs) are submitted first.
+
+        As with the default graph executor, this cannot handle parallelizable[]/collect[] nodes --
+        use the task-based executor (`Builder().enable_dynamic_execution(...)`) for those.
+
+        Node-level lifecycle hooks/methods (E.G. `do_node_execute`) run on the worker threads, so
+        the adapters passed in must be thread-safe. If a node fails, nodes that have not started
+        are cancelled, but ones already running keep going until they finish -- possibly after the
+        error has been raised and `post_graph_execute` has been called.
+
+        :param adapter: Adapter to use for execution (optional).
+        :param max_workers: Maximum number of threads to use. Defaults to the ThreadPoolExecutor default.
+        :param cost_fn: Estimated cost of running a node, used to find the critical path.
+            Defaults to every node costing the same.
+        :param pgo: Whether to measure how long each node takes to run, and use that as its cost
+            (profile-guided optimization). Timings are a moving average across executions, and
+            priorities are recomputed from them every `pgo_interval` executions. Nodes that have
+            not been timed yet cost the mean timing, multiplied by `cost_fn` if passed -- so with
+            pgo, `cost_fn` is relative to an average node.
+        :param pgo_interval: Number of executions between recomputing priorities, if `pgo` is set.
+
+        Execution plans (the nodes to run, their dependencies and priorities) are cached per
+        graph and request shape (final vars, input names and override names), and the thread pool
+        is reused across calls, so repeated executes only pay for running the nodes.
+        This is safe to call from multiple threads at once.
+        """
+        super(ParallelGraphExecutor, self).__init__(adapter)
+        if max_workers is None:
+            # same default as ThreadPoolExecutor -- we need to know it to bound what's in flight
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+        self.cost_fn = cost_fn
+        self.pgo = pgo
+        self.pgo_interval = pgo_interval
+        # node name -> moving average of the seconds it takes to run. Only used with pgo
+        self._node_timings: Dict[str, float] = {}
+        self._executions_since_replan = 0
+        # graph -> request shape -> plan. Weak so graphs made for materialization don't pile up
+        self._plans = weakref.WeakKeyDictionary()
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_cost_fn(self) -> Optional[Callable[[node.Node], float]]:
+        """Gets the cost function to compute priorities with. With pgo, that is a node's measured
+        timing. Nodes that have not been timed yet get the mean timing (scaled by `cost_fn`, if
+        passed), so every cost is in seconds."""
+        if not self.pgo:
+            return self.cost_fn
+        with self._lock:
+            timings = dict(self._node_timings)
+        if not timings:
+            return self.cost_fn
+        mean_timing = sum(timings.values()) / len(timings)
+        cost_fn = self.cost_fn
+
+        def estimate_cost(node_: node.Node) -> float:
+            timing = timings.get(node_.name)
+            if timing is not None:
+                return timing
+            return mean_timing * (cost_fn(node_) if cost_fn is not None else 1)
+
+        return estimate_cost
+
+    def _record_timings(self, timings: Dict[str, float]):
+        """Folds the timings of an execution into the moving averages. Every `pgo_interval`
+        executions, drops the cached plans so they're recreated with priorities from the new costs.
+
+        :param timings: Node name -> seconds it took to run in this execution
+        """
+        with self._lock:
+            for name, seconds in timings.items():
+                previous = self._node_timings.get(name)
+                self._node_timings[name] = (
+                    seconds
+                    if previous is None
+                    else (1 - self.PGO_SMOOTHING) * previous + self.PGO_SMOOTHING * seconds
+                )
+            self._executions_since_replan += 1
+            if self._executions_since_replan >= self.pgo_interval:
+                self._executions_since_replan = 0
+                self._plans = weakref.WeakKeyDictionary()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Lazily creates the thread pool, which is then shared by all executions."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _get_plan(
+        self,
+        fg: graph.FunctionGraph,
+        final_vars: List[str],
+        overrides: Dict[str, Any],
+        inputs: Dict[str, Any],
+    ) -> graph_functions.ParallelExecutionPlan:
+        """Gets the execution plan for this request shape, creating it if we haven't yet.
+
+        :param fg: Graph to execute
+        :param final_vars: Final variables to compute
+        :param overrides: Overrides -- only the names matter
+        :param inputs: Inputs, combined with config -- only the names matter
+        :return: The plan to execute
+        """
+        key = (tuple(sorted(final_vars)), tuple(sorted(inputs)), tuple(sorted(overrides)))
+        with self._lock:
+            plans = self._plans.setdefault(fg, {})
+            plan = plans.get(key)
+        if plan is None:
+            # Racing threads may both create this, but they'll create the same thing
+            nodes, user_nodes = fg.get_upstream_nodes(final_vars, inputs, overrides)
+            all_nodes = nodes | user_nodes
+            plan = graph_functions.create_parallel_execution_plan(
+                all_nodes,
+                override_names=overrides,
+                priorities=graph_functions.compute_bottom_levels(all_nodes, self._get_cost_fn()),
+                retain=final_vars,  # intermediates get released as soon as they're consumed
+            )
+            with self._lock:
+                plans[key] = plan
+        return plan
+
+    def shutdown(self, wait: bool = True):
+        """Shuts down the thread pool. It will be recreated if this executes again.
+
+        :param wait: Whether to wait for running nodes to finish.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def execute(
+        self,
+        fg: graph.FunctionGraph,
+        final_vars: List[str],
+        overrides: Dict[str, Any],
+        inputs: Dict[str, Any],
+        run_id: str,
+    ) -> Dict[str, Any]:
+        """Executes the graph, dispatching nodes to a thread pool in topological order,
+        prioritized by their bottom level."""
+        inputs = graph_functions.combine_config_and_inputs(fg.config, inputs)
+        timings = {} if self.pgo else None
+        computed = graph_functions.execute_parallel_execution_plan(
+            self._get_plan(fg, final_vars, overrides, inputs),
+            inputs,
+            self._get_pool(),
+            adapter=fg.adapter,
+            overrides=overrides,
+            run_id=run_id,
+            max_concurrency=self.max_workers,
+            timings=timings,
+        )
+        if timings is not None:
+            self._record_timings(timings)
+        return _select_outputs(final_vars, computed, inputs)
+
+
 class TaskBasedGraphExecutor(GraphExecutor):
     def validate(self, nodes_to_execute: List[node.Node]):
         """Currently this can run every valid graph"""
@@ -405,6 +656,12 @@ class Driver:
                 _graph_executor = DefaultGraphExecutor(self.adapter)
             self.graph_executor = _graph_executor
             self.config = config
+            # The graph is immutable once built, so this never needs invalidation. See `_get_upstream_nodes`
+            self._upstream_nodes_cache = {}
+            # Input type checks, keyed by (node type, input type). See `validate_inputs`
+            self._type_check_cache = {}
+            # final vars -> compiled plan. See `compile_plan`
+            self._compiled_plans = {}
         except Exception as e:
             error = telemetry.sanitize_error(*sys.exc_info())
             logger.error(SLACK_ERROR_MESSAGE)
@@ -475,6 +732,7 @@ class Driver:
         user_nodes: Collection[node.Node],
         inputs: typing.Optional[Dict[str, Any]] = None,
         nodes_set: Collection[node.Node] = None,
+        type_check_cache: Optional[Dict[Tuple[Any, type], bool]] = None,
     ):
         """Validates that inputs meet our expectations. This means that:
         1. The runtime inputs don't clash with the graph's config
@@ -485,6 +743,9 @@ class Driver:
         :param user_nodes: The required nodes we need for computation.
         :param inputs: the user inputs provided.
         :param nodes_set: the set of nodes to use for validation; Optional.
+        :param type_check_cache: Optional. Cache of type check results, keyed by (node type, input type).
+            Only used if the type check only depends on the type of the input, I.E. if no adapter
+            overrides `do_validate_input` or the one that does is marked as `input_validation_cacheable`.
         """
         # TODO -- determine whether or not we want to use the legacy adapter if nothing is here
         # We shouldn't need to do this (normalize the inputs), as we have already, but the bigger issue
@@ -495,32 +756,48 @@ class Driver:
             inputs = {}
         if nodes_set is None:
             nodes_set = set(fn_graph.nodes.values())
-        (all_inputs,) = (graph_functions.combine_config_and_inputs(fn_graph.config, inputs),)
+        # Config and inputs are only looked up here -- merging them is left to the executor
+        config = fn_graph.config
+        graph_functions.validate_config_and_inputs_disjoint(config, inputs)
+        # resolved once -- the adapter set doesn't change while we validate
+        use_adapter_validation = adapter.does_method("do_validate_input", is_async=False)
+        check_input_type = (
+            adapter.get_lifecycle_method_sync("do_validate_input")
+            if use_adapter_validation
+            else htypes.check_input_type
+        )
+        if use_adapter_validation and type_check_cache is not None:
+            if not all(
+                _input_validation_is_cacheable(validating_adapter)
+                for validating_adapter in adapter.sync_methods["do_validate_input"]
+            ):
+                type_check_cache = None
         errors = []
         for user_node in user_nodes:
-            if user_node.name not in all_inputs:
+            input_value = inputs.get(user_node.name, _MISSING)
+            if input_value is _MISSING:
+                input_value = config.get(user_node.name, _MISSING)
+            if input_value is _MISSING:
                 if graph_functions.node_is_required_by_anything(user_node, nodes_set):
                     errors.append(
                         f"Error: Required input {user_node.name} not provided "
                         f"for nodes: {[node.name for node in user_node.depended_on_by]}."
                     )
-            else:
-                valid = all_inputs[user_node.name] is None
-                if adapter.does_method("do_validate_input", is_async=False):
-                    # For now this is an or-gate, as are the rest.
-                    # We may consider changing this/adding another method or type
-                    valid |= adapter.call_lifecycle_method_sync(
-                        "do_validate_input",
-                        node_type=user_node.type,
-                        input_value=all_inputs[user_node.name],
-                    )
-                else:
-                    valid |= htypes.check_input_type(user_node.type, all_inputs[user_node.name])
-                if not valid:
-                    errors.append(
-                        f"Error: Type requirement mismatch. Expected {user_node.name}:{user_node.type} "  # noqa: E231
-                        f"got {all_inputs[user_node.name]}:{type(all_inputs[user_node.name])} instead."  # noqa: E231
-                    )
+                continue
+            valid = input_value is None
+            cache_key = (user_node.type, type(input_value))
+            type_checks = _get_type_check(type_check_cache, cache_key)
+            if type_checks is None:
+                type_checks = check_input_type(node_type=user_node.type, input_value=input_value)
+                _set_type_check(type_check_cache, cache_key, type_checks)
+            # For now this is an or-gate, as are the rest.
+            # We may consider changing this/adding another method or type
+            valid |= type_checks
+            if not valid:
+                errors.append(
+                    f"Error: Type requirement mismatch. Expected {user_node.name}:{user_node.type} "  # noqa: E231
+                    f"got {input_value}:{type(input_value)} instead."  # noqa: E231
+                )
         if errors:
             errors.sort()
             error_str = f"{len(errors)} errors encountered: \n  " + "\n  ".join(errors)
@@ -544,10 +821,7 @@ class Driver:
             dataframe.
         """
         if display_graph:
-            logger.warning(
-                "display_graph=True is deprecated. It will be removed in the 2.0.0 release. "
-                "Please use visualize_execution()."
-            )
+            _warn_display_graph_deprecated()
         start_time = time.time()
         run_successful = True
         error = None
@@ -570,6 +844,141 @@ class Driver:
                 error, _final_vars, inputs, overrides, run_successful, duration
             )
 
+    def execute_batch(
+        self,
+        final_vars: List[Union[str, Callable, Variable]],
+        inputs: typing.Iterable[Dict[str, Any]],
+        overrides: Dict[str, Any] = None,
+    ) -> List[Any]:
+        """Executes the same request once for each set of inputs, E.G. to backtest over many dates.
+
+        This is equivalent to calling `.execute()` in a loop, but resolves the final vars once.
+        Everything that only depends on the shape of the request (the upstream nodes, input type checks,
+        and, with `Builder().enable_parallel_node_execution()`, the execution plan and thread pool)
+        is computed on the first call and reused for the rest.
+
+        .. code-block:: python
+
+            results = dr.execute_batch(
+                ["signal"], inputs=[{"date": date} for date in dates]
+            )
+
+        :param final_vars: the final list of outputs we want to compute.
+        :param inputs: Runtime inputs to the DAG, one dict per execution.
+        :param overrides: values that will override "nodes" in the DAG, shared by all executions.
+        :return: A list with the result of each execution, in the same order as `inputs`.
+        """
+        _final_vars = self._create_final_vars(final_vars)
+        return [
+            self.execute(_final_vars, overrides, inputs=batch_inputs) for batch_inputs in inputs
+        ]
+
+    @capture_function_usage
+    def compile_plan(
+        self, final_vars: List[Union[str, Callable, Variable]]
+    ) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """Compiles the computation of `final_vars` into a single python function of the runtime inputs.
+
+        The function calls each node's function directly, in order, so it skips all the per-execution
+        work `.execute()` does (walking the DAG, validating inputs, calling adapters, building the result).
+        Use this when you compute the same variables over and over again, E.G. in a server.
+
+        .. code-block:: python
+
+            plan = dr.compile_plan(["prediction"])
+            for request in requests:
+                result = plan({"features": request.features})  # {"prediction": ...}
+
+        Note that, as it skips the adapters, this cannot be used with lifecycle adapters that hook into
+        execution (E.G. progress bars, tracking, or executing nodes remotely). Input types are also not
+        validated -- passing in the wrong type will fail (or not) in the functions themselves.
+        Overrides are not supported.
+
+        The compiled function is cached, so calling this again with the same final vars is cheap.
+        It is safe to call the compiled function from multiple threads at once.
+
+        :param final_vars: the final list of outputs we want to compute.
+        :return: A function that takes in a dict of runtime inputs, and returns a dict of final var -> result.
+        :raises ValueError: If an adapter hooks into execution.
+        :raises InvalidExecutorException: If the graph contains parallelizable[]/collect[] nodes.
+        """
+        _final_vars = self._create_final_vars(final_vars)
+        key = tuple(_final_vars)
+        compiled_plan = self._compiled_plans.get(key)
+        if compiled_plan is None:
+            self._validate_adapter_can_be_compiled()
+            nodes, user_nodes = self._get_upstream_nodes(_final_vars)
+            all_nodes = nodes | user_nodes
+            # same restrictions as executing nodes one after the other in memory
+            DefaultGraphExecutor(self.adapter).validate(list(all_nodes))
+            compiled_plan = self._compiled_plans[key] = graph_functions.compile_execution_plan(
+                all_nodes, _final_vars, self.graph.config
+            )
+        return compiled_plan
+
+    def _validate_adapter_can_be_compiled(self):
+        """Ensures no adapter would be skipped by a compiled plan. The only node executors allowed
+        are the plain python graph adapters, which just call the node's function.
+
+        :raises ValueError: If an adapter hooks into execution.
+        """
+        execution_hooks = [
+            "pre_graph_execute",
+            "pre_node_execute",
+            "post_node_execute",
+            "post_graph_execute",
+        ]
+        unsupported = [hook for hook in execution_hooks if self.adapter.does_hook(hook)]
+        node_executors = self.adapter.sync_methods.get("do_node_execute", [])
+        if self.adapter.does_method("do_node_execute", is_async=True) or not all(
+            isinstance(node_executor, base.SimplePythonDataFrameGraphAdapter)
+            and type(node_executor).execute_node
+            is base.SimplePythonDataFrameGraphAdapter.execute_node
+            for node_executor in node_executors
+        ):
+            unsupported.append("do_node_execute")
+        if unsupported:
+            raise ValueError(
+                f"Cannot compile a plan with adapters that hook into execution, as they would be skipped. "
+                f"Adapters implement: {unsupported}. Use .execute() instead."
+            )
+
+    def _get_upstream_nodes(
+        self,
+        final_vars: List[str],
+        inputs: Optional[Dict[str, Any]] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+        _fn_graph: graph.FunctionGraph = None,
+    ) -> Tuple[FrozenSet[node.Node], FrozenSet[node.Node]]:
+        """Memoized version of `FunctionGraph.get_upstream_nodes`. The traversal only depends on
+        which inputs/overrides are passed, not on their values, so repeated calls with the same
+        request shape (E.G. a server calling `.execute()` in a loop) skip the DAG walk entirely.
+
+        Note that this only caches for the driver's own graph -- if `_fn_graph` is a different graph
+        (E.G. one modified by materialization) we just delegate.
+
+        :param final_vars: Final variables to compute
+        :param inputs: Runtime inputs -- None means we're at compile-time, see `get_upstream_nodes`.
+        :param overrides: Runtime overrides
+        :param _fn_graph: The function graph to traverse. Defaults to the driver's graph.
+        :return: A tuple of frozensets -- all nodes, and the subset that are user inputs.
+        """
+        function_graph = _fn_graph if _fn_graph is not None else self.graph
+        if function_graph is not self.graph:
+            nodes, user_nodes = function_graph.get_upstream_nodes(final_vars, inputs, overrides)
+            return frozenset(nodes), frozenset(user_nodes)
+        key = (
+            tuple(sorted(final_vars)),
+            tuple(sorted(inputs)) if inputs is not None else None,
+            tuple(sorted(overrides)) if overrides is not None else None,
+        )
+        cached = self._upstream_nodes_cache.get(key)
+        if cached is None:
+            # Racing threads may both compute this, but they'll compute the same thing
+            nodes, user_nodes = self.graph.get_upstream_nodes(final_vars, inputs, overrides)
+            cached = self._upstream_nodes_cache[key] = (frozenset(nodes), frozenset(user_nodes))
+        return cached
+
     def _create_final_vars(self, final_vars: List[Union[str, Callable, Variable]]) -> List[str]:
         """Creates the final variables list - converting functions names as required.
 
@@ -642,19 +1051,37 @@ class Driver:
         """
         function_graph = _fn_graph if _fn_graph is not None else self.graph
         run_id = str(uuid.uuid4())
-        nodes, user_nodes = function_graph.get_upstream_nodes(final_vars, inputs, overrides)
+        input_only_nodes = (
+            None
+            if display_graph
+            else Driver._get_input_only_nodes(function_graph, final_vars, inputs, overrides)
+        )
+        if input_only_nodes is not None:
+            # Only inputs were requested -- they have no upstream nodes, and nothing to execute
+            nodes = user_nodes = input_only_nodes
+        else:
+            nodes, user_nodes = self._get_upstream_nodes(
+                final_vars, inputs, overrides, function_graph
+            )
         Driver.validate_inputs(
-            function_graph, self.adapter, user_nodes, inputs, nodes
+            function_graph, self.adapter, user_nodes, inputs, nodes, self._type_check_cache
         )  # TODO -- validate within the function graph itself
         if display_graph:  # deprecated flow.
-            logger.warning(
-                "display_graph=True is deprecated. It will be removed in the 2.0.0 release. "
-                "Please use visualize_execution()."
+            _warn_display_graph_deprecated()
+            # reuses the nodes computed above, which have already been validated
+            Driver._visualize_execution_helper(
+                function_graph,
+                self.adapter,
+                final_vars,
+                "test-output/execute.gv",
+                {"view": True},
+                inputs=inputs,
+                overrides=overrides,
+                bypass_validation=True,
+                upstream_nodes=(nodes, user_nodes),
             )
-            self.visualize_execution(final_vars, "test-output/execute.gv", {"view": True})
-            if self.has_cycles(
-                final_vars, function_graph
-            ):  # here for backwards compatible driver behavior.
+            # here for backwards compatible driver behavior
+            if function_graph.has_cycles(nodes, user_nodes):
                 raise ValueError("Error: cycles detected in your graph.")
         all_nodes = nodes | user_nodes
         self.graph_executor.validate(list(all_nodes))
@@ -671,13 +1098,23 @@ class Driver:
         error = None
         success = False
         try:
-            results = self.graph_executor.execute(
-                function_graph,
-                final_vars,
-                overrides if overrides is not None else {},
-                inputs if inputs is not None else {},
-                run_id,
-            )
+            if input_only_nodes is not None:
+                results = {
+                    final_var: (
+                        inputs[final_var]
+                        if inputs is not None and final_var in inputs
+                        else function_graph.config[final_var]
+                    )
+                    for final_var in final_vars
+                }
+            else:
+                results = self.graph_executor.execute(
+                    function_graph,
+                    final_vars,
+                    overrides if overrides is not None else {},
+                    inputs if inputs is not None else {},
+                    run_id,
+                )
             success = True
         except Exception as e:
             error = e
@@ -695,6 +1132,34 @@ class Driver:
                 )
         return results
 
+    @staticmethod
+    def _get_input_only_nodes(
+        fn_graph: graph.FunctionGraph,
+        final_vars: List[str],
+        inputs: Optional[Dict[str, Any]],
+        overrides: Optional[Dict[str, Any]],
+    ) -> Optional[FrozenSet[node.Node]]:
+        """Checks whether every requested variable is an input that is provided (in config or inputs).
+        If so, there is nothing to execute -- the results are just the provided values.
+
+        :param fn_graph: Graph to execute
+        :param final_vars: Final variables to compute
+        :param inputs: Runtime inputs
+        :param overrides: Runtime overrides
+        :return: The nodes for the requested inputs, or None if anything needs to be executed.
+        """
+        if overrides or not final_vars:
+            return None
+        input_only_nodes = []
+        for final_var in final_vars:
+            node_ = fn_graph.nodes.get(final_var)
+            if node_ is None or not node_.user_defined:
+                return None
+            if not ((inputs is not None and final_var in inputs) or final_var in fn_graph.config):
+                return None
+            input_only_nodes.append(node_)
+        return frozenset(input_only_nodes)
+
     @capture_function_usage
     def list_available_variables(
         self, *, tag_filter: Dict[str, Union[Optional[str], List[str]]] = None
@@ -728,7 +1193,25 @@ class Driver:
             is non-empty we will return all nodes with that tag and that value.
         :return: list of available variables (i.e. outputs).
         """
-        all_nodes = self.graph.get_nodes()
+        return list(self._iter_available_variables(tag_filter))
+
+    @capture_function_usage
+    def iter_available_variables(
+        self, *, tag_filter: Dict[str, Union[Optional[str], List[str]]] = None
+    ) -> typing.Iterator[Variable]:
+        """Same as `list_available_variables`, but yields the variables one at a time rather than
+        creating them all up-front. Use this if you're streaming through the variables of a large DAG.
+
+        :param tag_filter: A dictionary of tags to filter by. See `list_available_variables`.
+        :return: iterator over the available variables (i.e. outputs).
+        """
+        return self._iter_available_variables(tag_filter)
+
+    def _iter_available_variables(
+        self, tag_filter: Optional[Dict[str, Union[Optional[str], List[str]]]]
+    ) -> typing.Iterator[Variable]:
+        """Validates the tag filter, then returns an iterator over the variables matching it.
+        This is not a generator itself, so an invalid filter raises when this is called."""
         if tag_filter:
             valid_filter_values = all(
                 map(
@@ -740,13 +1223,11 @@ class Driver:
             )
             if not valid_filter_values:
                 raise ValueError("All tag query values must be a string or list of strings")
-            results = []
-            for n in all_nodes:
-                if node.matches_query(n.tags, tag_filter):
-                    results.append(Variable.from_node(n))
-        else:
-            results = [Variable.from_node(n) for n in all_nodes]
-        return results
+        return (
+            Variable.from_node(n)
+            for n in self.graph.get_nodes()
+            if not tag_filter or node.matches_query(n.tags, tag_filter)
+        )
 
     @capture_function_usage
     def display_all_functions(
@@ -820,6 +1301,7 @@ class Driver:
         custom_style_function: Callable = None,
         bypass_validation: bool = False,
         keep_dot: bool = False,
+        upstream_nodes: Tuple[Collection[node.Node], Collection[node.Node]] = None,
     ):
         """Helper function to visualize execution, using a passed-in function graph.
 
@@ -835,10 +1317,14 @@ class Driver:
         :param show_schema: If True, display the schema of the DAG if nodes have schema data provided
         :param custom_style_function: Optional. Custom style function.
         :param keep_dot: If true, produce a DOT file (ref: https://graphviz.org/doc/info/lang.html)
+        :param upstream_nodes: Optional. The (nodes, user nodes) upstream of the final vars, if already
+            computed -- saves traversing the graph again.
         :return: the graphviz object if you want to do more with it.
         """
         # TODO should determine if the visualization logic should live here or in the graph.py module
-        nodes, user_nodes = fn_graph.get_upstream_nodes(final_vars, inputs, overrides)
+        if upstream_nodes is None:
+            upstream_nodes = fn_graph.get_upstream_nodes(final_vars, inputs, overrides)
+        nodes, user_nodes = upstream_nodes
         if not bypass_validation:
             Driver.validate_inputs(fn_graph, adapter, user_nodes, inputs, nodes)
         node_modifiers = {fv: {graph.VisualizationNodeModifiers.IS_OUTPUT} for fv in final_vars}
@@ -961,8 +1447,10 @@ class Driver:
         :param overrides: Optional. Overrides to the DAG.
         :return: JSON string representation of the graph.
         """
-        nodes, user_nodes = self.graph.get_upstream_nodes(final_vars, inputs, overrides)
-        Driver.validate_inputs(self.graph, self.adapter, user_nodes, inputs, nodes)
+        nodes, user_nodes = self._get_upstream_nodes(final_vars, inputs, overrides)
+        Driver.validate_inputs(
+            self.graph, self.adapter, user_nodes, inputs, nodes, self._type_check_cache
+        )
         all_nodes = nodes | user_nodes
 
         hamilton_nodes = [HamiltonNode.from_node(n).as_dict() for n in all_nodes]
@@ -984,7 +1472,7 @@ class Driver:
         function_graph = _fn_graph if _fn_graph is not None else self.graph
         _final_vars = self._create_final_vars(final_vars)
         # get graph we'd be executing over
-        nodes, user_nodes = function_graph.get_upstream_nodes(_final_vars)
+        nodes, user_nodes = self._get_upstream_nodes(_final_vars, _fn_graph=function_graph)
         return self.graph.has_cycles(nodes, user_nodes)
 
     @capture_function_usage
@@ -1504,17 +1992,10 @@ class Driver:
                     config=function_graph.config,
                 )
 
-            # need to validate the right inputs has been provided.
-            # we do this on the modified graph.
+            # raw_execute validates that the right inputs have been provided on the modified graph.
             # Note we will not run the loaders if they're not upstream of the
             # materializers or additional_vars
             materializer_vars = [m.id for m in materializer_factories]
-            nodes, user_nodes = function_graph.get_upstream_nodes(
-                final_vars + materializer_vars, inputs, overrides
-            )
-            Driver.validate_inputs(function_graph, self.adapter, user_nodes, inputs, nodes)
-            all_nodes = nodes | user_nodes
-            self.graph_executor.validate(list(all_nodes))
             raw_results = self.raw_execute(
                 final_vars=final_vars + materializer_vars,
                 inputs=inputs,
@@ -1620,8 +2101,10 @@ class Driver:
         :param inputs: Inputs to pass to execution.
         :raise ValueError: if any issues with executino can be detected.
         """
-        nodes, user_nodes = self.graph.get_upstream_nodes(final_vars, inputs, overrides)
-        Driver.validate_inputs(self.graph, self.adapter, user_nodes, inputs, nodes)
+        nodes, user_nodes = self._get_upstream_nodes(final_vars, inputs, overrides)
+        Driver.validate_inputs(
+            self.graph, self.adapter, user_nodes, inputs, nodes, self._type_check_cache
+        )
         self.graph_executor.validate(list(nodes | user_nodes))
 
     def validate_materialization(
@@ -1657,7 +2140,9 @@ class Driver:
         nodes, user_nodes = function_graph.get_upstream_nodes(
             final_vars + materializer_vars, inputs, overrides
         )
-        Driver.validate_inputs(function_graph, self.adapter, user_nodes, inputs, nodes)
+        Driver.validate_inputs(
+            function_graph, self.adapter, user_nodes, inputs, nodes, self._type_check_cache
+        )
         all_nodes = nodes | user_nodes
         self.graph_executor.validate(list(all_nodes))
 
@@ -1683,6 +2168,13 @@ class Builder:
         self.remote_executor = None
         self.grouping_strategy = None
 
+        # Parallel node execution fields
+        self.parallel_node_execution = False
+        self.max_parallel_workers = None
+        self.node_cost_fn = None
+        self.node_pgo = False
+        self.node_pgo_interval = 10
+
     def _require_v2(self, message: str):
         if not self.v2_executor:
             raise ValueError(message)
@@ -1706,9 +2198,48 @@ class Builder:
                 "Remote execution is currently experimental. "
                 "Please set allow_experiemental_mode=True to enable it."
             )
+        self._require_field_unset(
+            "parallel_node_execution",
+            "Cannot enable dynamic execution with parallel node execution enabled -- "
+            "these are disjoint",
+            unset_value=False,
+        )
         self.v2_executor = True
         return self
 
+    def enable_parallel_node_execution(
+        self,
+        max_workers: Optional[int] = None,
+        cost_fn: Optional[Callable[[node.Node], float]] = None,
+        pgo: bool = False,
+        pgo_interval: int = 10,
+    ) -> "Builder":
+        """Runs independent nodes concurrently on a thread pool, as soon as their dependencies
+        are computed. This does not enable the Parallelizable[] type -- for that, use
+        `enable_dynamic_execution`.
+
+        :param max_workers: Maximum number of threads to use. Defaults to the ThreadPoolExecutor default.
+        :param cost_fn: Estimated cost of running a node. When more nodes are ready than there are
+            workers, the ones on the most expensive path get run first. Defaults to uniform cost.
+        :param pgo: Whether to time each node as it runs, and use those timings as the costs.
+            Nodes that haven't run yet cost the mean timing, multiplied by `cost_fn` if passed.
+            Priorities are periodically recomputed, so the driver tunes itself to your workload.
+        :param pgo_interval: Number of executions between recomputing priorities, if `pgo` is set.
+        :return: self
+        """
+        self._require_field_unset(
+            "v2_executor",
+            "Cannot enable parallel node execution with dynamic execution enabled -- "
+            "these are disjoint",
+            unset_value=False,
+        )
+        self.parallel_node_execution = True
+        self.max_parallel_workers = max_workers
+        self.node_cost_fn = cost_fn
+        self.node_pgo = pgo
+        self.node_pgo_interval = pgo_interval
+        return self
+
     def with_config(self, config: Dict[str, Any]) -> "Builder":
         """Adds the specified configuration to the config.
         This can be called multilple times -- later calls will take precedence.
@@ -1862,6 +2393,14 @@ class Builder:
                 grouping_strategy=grouping_strategy,
                 adapter=lifecycle_base.LifecycleAdapterSet(*adapter),
             )
+        elif self.parallel_node_execution:
+            graph_executor = ParallelGraphExecutor(
+                lifecycle_base.LifecycleAdapterSet(*adapter),
+                max_workers=self.max_parallel_workers,
+                cost_fn=self.node_cost_fn,
+                pgo=self.node_pgo,
+                pgo_interval=self.node_pgo_interval,
+            )
 
         return Driver(
             self.config,
@@ -1888,6 +2427,11 @@ class Builder:
         new_builder.local_executor = self.local_executor
         new_builder.remote_executor = self.remote_executor
         new_builder.grouping_strategy = self.grouping_strategy
+        new_builder.parallel_node_execution = self.parallel_node_execution
+        new_builder.max_parallel_workers = self.max_parallel_workers
+        new_builder.node_cost_fn = self.node_cost_fn
+        new_builder.node_pgo = self.node_pgo
+        new_builder.node_pgo_interval = self.node_pgo_interval
         return new_builder
 
 
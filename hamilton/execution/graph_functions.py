@@ -1,6 +1,12 @@
+import dataclasses
+import heapq
+import itertools
+import keyword
 import logging
 import pprint
-from typing import Any, Collection, Dict, List, Optional, Set, Tuple
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from typing import Any, Callable, Collection, Dict, List, Optional, Set, Tuple
 
 from hamilton import node
 from hamilton.lifecycle.base import LifecycleAdapterSet
@@ -80,11 +86,40 @@ def get_node_levels(topologically_sorted_nodes: List[node.Node]) -> Dict[str, in
     return node_levels
 
 
-def combine_config_and_inputs(config: Dict[str, Any], inputs: Dict[str, Any]) -> Dict[str, Any]:
-    """Validates and combines config and inputs, ensuring that they're mutually disjoint.
+def compute_bottom_levels(
+    nodes: Collection[node.Node], cost_fn: Callable[[node.Node], float] = None
+) -> Dict[str, float]:
+    """Computes the "bottom level" of each node -- the cost of the most expensive path from it
+    to the end of the (sub)graph, inclusive of itself. Nodes on the critical path have the
+    highest bottom level, so scheduling by it ensures long dependency chains get started first.
+
+    Only edges between nodes in the passed-in collection are counted.
+
+    :param nodes: Nodes to compute the bottom levels of
+    :param cost_fn: Estimated cost of a node. Defaults to 1 for every node.
+    :return: A dictionary of node name -> bottom level
+    """
+    if cost_fn is None:
+        cost_fn = lambda node_: 1  # noqa: E731
+    node_names = {node_.name for node_ in nodes}
+    bottom_levels = {}
+    for node_ in reversed(topologically_sort_nodes(list(nodes))):
+        bottom_levels[node_.name] = cost_fn(node_) + max(
+            (
+                # nodes that are part of a cycle cannot be sorted, so they may be missing
+                bottom_levels.get(downstream_node.name, 0)
+                for downstream_node in node_.depended_on_by
+                if downstream_node.name in node_names
+            ),
+            default=0,
+        )
+    return bottom_levels
+
+
+def validate_config_and_inputs_disjoint(config: Dict[str, Any], inputs: Dict[str, Any]):
+    """Validates that config and inputs are mutually disjoint, without combining them.
     :param config: Config to construct, run the DAG with.
     :param inputs: Inputs to run the DAG on at runtime
-    :return: The combined set of inputs to the DAG.
     :raises ValueError: if they are not disjoint
     """
     duplicated_inputs = [key for key in inputs if key in config]
@@ -93,6 +128,16 @@ def combine_config_and_inputs(config: Dict[str, Any], inputs: Dict[str, Any]) ->
             f"The following inputs are present in both config and inputs. They must be "
             f"mutually disjoint. {duplicated_inputs} "
         )
+
+
+def combine_config_and_inputs(config: Dict[str, Any], inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Validates and combines config and inputs, ensuring that they're mutually disjoint.
+    :param config: Config to construct, run the DAG with.
+    :param inputs: Inputs to run the DAG on at runtime
+    :return: The combined set of inputs to the DAG.
+    :raises ValueError: if they are not disjoint
+    """
+    validate_config_and_inputs_disjoint(config, inputs)
     return {**config, **inputs}
 
 
@@ -145,6 +190,430 @@ def create_error_message(kwargs: dict, node_: node.Node, step: str) -> str:
     return message
 
 
+def execute_lifecycle_for_node(
+    node_: node.Node,
+    kwargs: Dict[str, Any],
+    adapter: LifecycleAdapterSet,
+    run_id: Optional[str],
+    task_id: Optional[str] = None,
+) -> Any:
+    """Executes a single node, calling the node-level lifecycle hooks/methods around it.
+
+    :param node_: Node to execute
+    :param kwargs: Already-resolved keyword arguments to pass to the node
+    :param adapter: Adapter to use to compute
+    :param run_id: Run ID to use
+    :param task_id: Task ID to use -- this is optional for the purpose of the task-based execution...
+    :return: The result of the node.
+    """
+    error = None
+    result = None
+    success = True
+    pre_node_execute_errored = False
+    try:
+        if adapter.does_hook("pre_node_execute", is_async=False):
+            try:
+                adapter.call_all_lifecycle_hooks_sync(
+                    "pre_node_execute",
+                    run_id=run_id,
+                    node_=node_,
+                    kwargs=kwargs,
+                    task_id=task_id,
+                )
+            except Exception as e:
+                pre_node_execute_errored = True
+                raise e
+        if adapter.does_method("do_node_execute", is_async=False):
+            result = adapter.call_lifecycle_method_sync(
+                "do_node_execute",
+                run_id=run_id,
+                node_=node_,
+                kwargs=kwargs,
+                task_id=task_id,
+            )
+        else:
+            result = node_(**kwargs)
+    except Exception as e:
+        success = False
+        error = e
+        step = "[pre-node-execute]" if pre_node_execute_errored else ""
+        message = create_error_message(kwargs, node_, step)
+        logger.exception(message)
+        raise
+    finally:
+        if not pre_node_execute_errored and adapter.does_hook("post_node_execute", is_async=False):
+            try:
+                adapter.call_all_lifecycle_hooks_sync(
+                    "post_node_execute",
+                    run_id=run_id,
+                    node_=node_,
+                    kwargs=kwargs,
+                    success=success,
+                    error=error,
+                    result=result,
+                    task_id=task_id,
+                )
+            except Exception:
+                message = create_error_message(kwargs, node_, "[post-node-execute]")
+                logger.exception(message)
+                raise
+    return result
+
+
+def _timed_execute_lifecycle_for_node(
+    node_: node.Node, kwargs: Dict[str, Any], adapter: LifecycleAdapterSet, run_id: Optional[str]
+) -> Tuple[Any, float]:
+    """Runs `execute_lifecycle_for_node`, also returning how long it took in seconds.
+    This runs in the worker, so time spent queued up in the pool is not counted."""
+    start = time.perf_counter()
+    result = execute_lifecycle_for_node(node_, kwargs, adapter, run_id)
+    return result, time.perf_counter() - start
+
+
+# Marks slots in the (index-based) results of a parallel execution that hold nothing
+_NOT_COMPUTED = object()
+
+
+@dataclasses.dataclass(frozen=True)
+class ParallelExecutionPlan:
+    """Everything `execute_subdag_in_parallel` needs to know about the subdag that does not depend
+    on the values of inputs/overrides. Nodes are assigned an integer index (their position in
+    `nodes`), and all bookkeeping is done with lists indexed by that, rather than with dicts
+    keyed by name. This way, a run only has to copy a few lists.
+
+    Create with `create_parallel_execution_plan`.
+    """
+
+    nodes: List[node.Node]
+    # For each node, (index, name) of the dependencies it reads. Empty for inputs/overrides.
+    dependencies: List[List[Tuple[int, str]]]
+    # For each node, the indices of the nodes waiting on it
+    dependents: List[List[int]]
+    # For each node, the number of dependencies it waits on
+    in_degrees: List[int]
+    # For each node, its priority negated, as heapq pops the smallest first
+    heap_priorities: List[float]
+    # For each node, whether to keep its result around. None means keep all of them.
+    retained: Optional[List[bool]]
+    # For each node, the number of nodes that read its result. None if we keep all of them.
+    consumer_counts: Optional[List[int]]
+
+
+def create_parallel_execution_plan(
+    nodes: Collection[node.Node],
+    override_names: Collection[str] = (),
+    priorities: Dict[str, float] = None,
+    retain: Collection[str] = None,
+) -> ParallelExecutionPlan:
+    """Creates the plan used by `execute_parallel_execution_plan`.
+
+    :param nodes: All nodes required for computation
+    :param override_names: Names of the nodes that will be overridden -- these do not wait on anything
+    :param priorities: Node name -> priority. Ready nodes with higher priority get submitted first.
+    :param retain: Names of the results to hold on to (E.G. the final vars). Defaults to all of them.
+    :return: The plan to execute
+    """
+    if priorities is None:
+        priorities = {}
+    override_names = set(override_names)
+    # sorted so the indices are stable for a given set of nodes
+    ordered_nodes = sorted(set(nodes), key=lambda node_: node_.name)
+    index = {node_.name: i for i, node_ in enumerate(ordered_nodes)}
+    dependencies = []
+    dependents = [[] for _ in ordered_nodes]
+    for i, node_ in enumerate(ordered_nodes):
+        # inputs and overrides never read their dependencies, so they don't wait on them either
+        if node_.name in override_names or node_.user_defined:
+            dependencies.append([])
+            continue
+        node_dependencies = [
+            (index[dep.name], dep.name) for dep in node_.dependencies if dep.name in index
+        ]
+        for dep_index, _ in node_dependencies:
+            dependents[dep_index].append(i)
+        dependencies.append(node_dependencies)
+    retained = None
+    consumer_counts = None
+    if retain is not None:
+        retain = set(retain)
+        retained = [node_.name in retain for node_ in ordered_nodes]
+        consumer_counts = [len(node_dependents) for node_dependents in dependents]
+    return ParallelExecutionPlan(
+        nodes=ordered_nodes,
+        dependencies=dependencies,
+        dependents=dependents,
+        in_degrees=[len(node_dependencies) for node_dependencies in dependencies],
+        heap_priorities=[-priorities.get(node_.name, 0) for node_ in ordered_nodes],
+        retained=retained,
+        consumer_counts=consumer_counts,
+    )
+
+
+def execute_parallel_execution_plan(
+    plan: ParallelExecutionPlan,
+    inputs: Dict[str, Any],
+    pool: Executor,
+    adapter: LifecycleAdapterSet = None,
+    overrides: Dict[str, Any] = None,
+    run_id: str = None,
+    max_concurrency: Optional[int] = None,
+    timings: Dict[str, float] = None,
+) -> Dict[str, Any]:
+    """Executes a plan, submitting each node to the pool as soon as all of its dependencies
+    have been computed. See `execute_subdag_in_parallel` for more details.
+
+    :param plan: Plan to execute, created with the same override names as `overrides`
+    :param inputs: Inputs, external (combined with config)
+    :param pool: Executor to submit node computation to
+    :param adapter: Adapter to use to compute
+    :param overrides: Overrides to use, will short-circuit computation
+    :param run_id: Run ID to use
+    :param max_concurrency: Maximum number of nodes to have in flight at once. Defaults to unbounded.
+    :param timings: If passed, filled with node name -> seconds the node took to execute.
+    :return: The results (only those retained by the plan)
+    :raises ValueError: if the nodes cannot all be scheduled, I.E. there is a cycle.
+    """
+    if overrides is None:
+        overrides = {}
+    if adapter is None:
+        adapter = LifecycleAdapterSet()
+    nodes = plan.nodes
+    retained = plan.retained
+    computed = [_NOT_COMPUTED] * len(nodes)
+    in_degrees = plan.in_degrees[:]
+    remaining_consumers = plan.consumer_counts[:] if plan.consumer_counts is not None else None
+    ready = []
+    tiebreaker = itertools.count()  # nodes are not comparable, so we break ties by push order
+    running = {}
+    execute_node = (
+        execute_lifecycle_for_node if timings is None else _timed_execute_lifecycle_for_node
+    )
+
+    def store(i: int, result: Any):
+        if remaining_consumers is not None and remaining_consumers[i] == 0 and not retained[i]:
+            return  # nothing will ever read it
+        computed[i] = result
+
+    def release(dependency_indices: List[Tuple[int, str]]):
+        if remaining_consumers is None:
+            return
+        for dep_index, _ in dependency_indices:
+            remaining_consumers[dep_index] -= 1
+            if remaining_consumers[dep_index] == 0 and not retained[dep_index]:
+                computed[dep_index] = _NOT_COMPUTED
+
+    def mark_complete(i: int):
+        for downstream_index in plan.dependents[i]:
+            in_degrees[downstream_index] -= 1
+            if in_degrees[downstream_index] == 0:
+                heapq.heappush(
+                    ready,
+                    (plan.heap_priorities[downstream_index], next(tiebreaker), downstream_index),
+                )
+
+    # Inputs and overrides never wait on anything (and do not need a worker), so we resolve them up-front
+    for i in [i for i, in_degree in enumerate(in_degrees) if in_degree == 0]:
+        node_ = nodes[i]
+        if node_.name in overrides:
+            store(i, overrides[node_.name])
+        elif node_.user_defined:
+            # if it's not provided it's optional -- otherwise validation would have caught it
+            if node_.name in inputs:
+                store(i, inputs[node_.name])
+        else:
+            heapq.heappush(ready, (plan.heap_priorities[i], next(tiebreaker), i))
+            continue
+        mark_complete(i)
+
+    try:
+        while ready or running:
+            while ready and (max_concurrency is None or len(running) < max_concurrency):
+                _, _, i = heapq.heappop(ready)
+                node_ = nodes[i]
+                kwargs = {}
+                for dep_index, dep_name in plan.dependencies[i]:
+                    value = computed[dep_index]
+                    if value is not _NOT_COMPUTED:
+                        kwargs[dep_name] = value
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Submitting {node_.name}.")
+                future = pool.submit(execute_node, node_, kwargs, adapter, run_id)
+                running[future] = i
+                release(plan.dependencies[i])
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                result = future.result()
+                if timings is not None:
+                    result, timings[nodes[i].name] = result
+                store(i, result)
+                mark_complete(i)
+    except BaseException:
+        for future in running:
+            future.cancel()
+        raise
+    unscheduled = [nodes[i].name for i, in_degree in enumerate(in_degrees) if in_degree > 0]
+    if unscheduled:
+        raise ValueError(f"Unable to schedule nodes: {unscheduled}. Check your graph for cycles.")
+    return {
+        node_.name: value for node_, value in zip(nodes, computed) if value is not _NOT_COMPUTED
+    }
+
+
+def execute_subdag_in_parallel(
+    nodes: Collection[node.Node],
+    inputs: Dict[str, Any],
+    pool: Executor,
+    adapter: LifecycleAdapterSet = None,
+    overrides: Dict[str, Any] = None,
+    run_id: str = None,
+    max_concurrency: Optional[int] = None,
+    priorities: Dict[str, float] = None,
+    retain: Collection[str] = None,
+) -> Dict[str, Any]:
+    """Executes a subdag, submitting each node to the pool as soon as all of its dependencies
+    have been computed. Unlike `execute_subdag`, this does not traverse the graph -- `nodes` has
+    to be the full set of nodes required for computation (E.G. the union of what
+    `FunctionGraph.get_upstream_nodes` returns).
+
+    All bookkeeping (in-degrees, the ready queue, the computed results) is done by the calling
+    thread, so no locking is required. Workers only ever run the node itself.
+
+    Ready nodes are kept in a heap, highest priority first. As the pool would otherwise queue
+    up work in submission order, we only submit up to `max_concurrency` nodes at once -- this
+    is what lets the priorities (see `compute_bottom_levels`) decide what runs next.
+
+    If `retain` is passed, we reference-count results: everything not in it is released as soon
+    as the last node consuming it has been submitted, so peak memory is bounded by the live
+    frontier of the DAG rather than by every intermediate computed.
+
+    This creates a `ParallelExecutionPlan` and executes it -- if you run the same subdag
+    repeatedly, create the plan once with `create_parallel_execution_plan` and use
+    `execute_parallel_execution_plan` directly.
+
+    :param nodes: All nodes required for computation
+    :param inputs: Inputs, external (combined with config)
+    :param pool: Executor to submit node computation to
+    :param adapter: Adapter to use to compute
+    :param overrides: Overrides to use, will short-circuit computation
+    :param run_id: Run ID to use
+    :param max_concurrency: Maximum number of nodes to have in flight at once. Defaults to unbounded.
+    :param priorities: Node name -> priority. Ready nodes with higher priority get submitted first.
+    :param retain: Names of the results to hold on to (E.G. the final vars). Defaults to all of them.
+    :return: The results (only those in `retain`, if passed)
+    :raises ValueError: if the nodes cannot all be scheduled, I.E. there is a cycle.
+    """
+    if overrides is None:
+        overrides = {}
+    plan = create_parallel_execution_plan(nodes, overrides, priorities, retain)
+    return execute_parallel_execution_plan(
+        plan,
+        inputs,
+        pool,
+        adapter=adapter,
+        overrides=overrides,
+        run_id=run_id,
+        max_concurrency=max_concurrency,
+    )
+
+
+def _format_call_kwargs(dependency_names: List[str], variables: Dict[str, str]) -> str:
+    """Formats keyword arguments for a generated call. Node names aren't always valid identifiers
+    (E.G. columns extracted from a dataframe), in which case we have to pass them in a dict."""
+    if all(name.isidentifier() and not keyword.iskeyword(name) for name in dependency_names):
+        return ", ".join(f"{name}={variables[name]}" for name in dependency_names)
+    return "**{" + ", ".join(f"{name!r}: {variables[name]}" for name in dependency_names) + "}"
+
+
+def compile_execution_plan(
+    nodes: Collection[node.Node], final_vars: List[str], config: Dict[str, Any]
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Generates a straight-line python function that computes `final_vars` from runtime inputs.
+
+    Each node's callable is called directly, in topological order, with its dependencies bound to
+    local variables -- there is no traversal, memoization dict or adapter in the loop. This means
+    that the caller is responsible for ensuring that no adapter needs to be involved in execution,
+    and that input types are not validated (missing required inputs, and inputs that are also in
+    the config, do raise an error).
+
+    The generated source is attached to the returned function as `source`, for debugging.
+
+    :param nodes: All nodes required for computation (E.G. the union of what
+        `FunctionGraph.get_upstream_nodes` returns)
+    :param final_vars: Variables to return
+    :param config: Config of the graph -- inputs in this are baked into the function
+    :return: A function of runtime inputs that returns a dict of final var -> result.
+    :raises ValueError: if the nodes cannot all be ordered, I.E. there is a cycle.
+    """
+    node_set = set(nodes)
+    sorted_nodes = topologically_sort_nodes(list(node_set))
+    if len(sorted_nodes) != len(node_set):
+        raise ValueError("Unable to order nodes for compilation. Check your graph for cycles.")
+    variables = {}  # node name -> local variable name
+    callables = []
+    constants = []
+    required_inputs = []
+    maybe_missing = set()  # optional inputs -- these may not be passed in
+    lines = []
+    for i, node_ in enumerate(sorted_nodes):
+        variable = variables[node_.name] = f"v{i}"
+        if node_.user_defined:
+            if node_.name in config:
+                lines.append(f"{variable} = _constants[{len(constants)}]  # {node_.name!r}")
+                constants.append(config[node_.name])
+            elif node_is_required_by_anything(node_, node_set):
+                lines.append(f"{variable} = inputs[{node_.name!r}]")
+                required_inputs.append(node_.name)
+            else:
+                lines.append(f"{variable} = inputs.get({node_.name!r}, _MISSING)")
+                maybe_missing.add(node_.name)
+            continue
+        dependency_names = [dep.name for dep in node_.dependencies if dep.name in variables]
+        passed = [name for name in dependency_names if name not in maybe_missing]
+        optional = [name for name in dependency_names if name in maybe_missing]
+        if optional:
+            # optional inputs that aren't passed in fall back to the function's default
+            passed_items = ", ".join(f"{name!r}: {variables[name]}" for name in passed)
+            lines.append(f"kwargs = {{{passed_items}}}")
+            for name in optional:
+                lines.append(f"if {variables[name]} is not _MISSING:")
+                lines.append(f"    kwargs[{name!r}] = {variables[name]}")
+            call_kwargs = "**kwargs"
+        else:
+            call_kwargs = _format_call_kwargs(passed, variables)
+        lines.append(f"{variable} = _callables[{len(callables)}]({call_kwargs})  # {node_.name!r}")
+        callables.append(node_.callable)
+    outputs = []
+    for final_var in final_vars:
+        variable = variables[final_var]
+        if final_var in maybe_missing:
+            variable = f"(None if {variable} is _MISSING else {variable})"
+        outputs.append(f"{final_var!r}: {variable}")
+    body = [
+        # same as execute -- config values are baked in, so they can't be overridden by inputs
+        "if not _config_keys.isdisjoint(inputs):",
+        "    _validate_config_and_inputs_disjoint(_config_keys, inputs)",
+        "missing = _required_inputs.difference(inputs)",
+        "if missing:",
+        "    raise ValueError(f'Required inputs not provided: {sorted(missing)}')",
+        *lines,
+        f"return {{{', '.join(outputs)}}}",
+    ]
+    source = "def compiled_plan(inputs):\n" + "".join(f"    {line}\n" for line in body)
+    namespace = {
+        "_callables": callables,
+        "_constants": constants,
+        "_required_inputs": frozenset(required_inputs),
+        "_config_keys": frozenset(config),
+        "_validate_config_and_inputs_disjoint": validate_config_and_inputs_disjoint,
+        "_MISSING": _NOT_COMPUTED,
+    }
+    exec(compile(source, "<hamilton compiled plan>", "exec"), namespace)
+    compiled_plan = namespace["compiled_plan"]
+    compiled_plan.source = source
+    return compiled_plan
+
+
 def execute_subdag(
     nodes: Collection[node.Node],
     inputs: Dict[str, Any],
@@ -187,7 +656,8 @@ def execute_subdag(
                 _, node_dependency_type = node_.input_types[n.name]
                 dfs_traverse(n, node_dependency_type)
 
-        logger.debug(f"Computing {node_.name}.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Computing {node_.name}.")
         if node_.user_defined:
             if node_.name not in inputs:
                 if dependency_type != node.DependencyType.OPTIONAL:
@@ -201,59 +671,7 @@ def execute_subdag(
             for dependency in node_.dependencies:
                 if dependency.name in computed:
                     kwargs[dependency.name] = computed[dependency.name]
-            error = None
-            result = None
-            success = True
-            pre_node_execute_errored = False
-            try:
-                if adapter.does_hook("pre_node_execute", is_async=False):
-                    try:
-                        adapter.call_all_lifecycle_hooks_sync(
-                            "pre_node_execute",
-                            run_id=run_id,
-                            node_=node_,
-                            kwargs=kwargs,
-                            task_id=task_id,
-                        )
-                    except Exception as e:
-                        pre_node_execute_errored = True
-                        raise e
-                if adapter.does_method("do_node_execute", is_async=False):
-                    result = adapter.call_lifecycle_method_sync(
-                        "do_node_execute",
-                        run_id=run_id,
-                        node_=node_,
-                        kwargs=kwargs,
-                        task_id=task_id,
-                    )
-                else:
-                    result = node_(**kwargs)
-            except Exception as e:
-                success = False
-                error = e
-                step = "[pre-node-execute]" if pre_node_execute_errored else ""
-                message = create_error_message(kwargs, node_, step)
-                logger.exception(message)
-                raise
-            finally:
-                if not pre_node_execute_errored and adapter.does_hook(
-                    "post_node_execute", is_async=False
-                ):
-                    try:
-                        adapter.call_all_lifecycle_hooks_sync(
-                            "post_node_execute",
-                            run_id=run_id,
-                            node_=node_,
-                            kwargs=kwargs,
-                            success=success,
-                            error=error,
-                            result=result,
-                            task_id=task_id,
-                        )
-                    except Exception:
-                        message = create_error_message(kwargs, node_, "[post-node-execute]")
-                        logger.exception(message)
-                        raise
+            result = execute_lifecycle_for_node(node_, kwargs, adapter, run_id, task_id)
 
         computed[node_.name] = result
         # > pruning the graph
@@ -346,11 +764,8 @@ def node_is_required_by_anything(node_: node.Node, node_set: Set[node.Node]) ->
     :param node_set: checks that we traverse only nodes in the provided set.
     :return: True if it is required by any downstream node, false otherwise
     """
-    required = False
-    for downstream_node in node_.depended_on_by:
-        if downstream_node not in node_set:
-            continue
-        _, dep_type = downstream_node.input_types[node_.name]
-        if dep_type == node.DependencyType.REQUIRED:
-            return True
-    return required
+    return any(
+        downstream_node.input_types[node_.name][1] == node.DependencyType.REQUIRED
+        for downstream_node in node_.depended_on_by
+        if downstream_node in node_set
+    )
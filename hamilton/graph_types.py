@@ -92,6 +92,19 @@ class HamiltonNode:
     to hide the internals of the system but expose what the user might need.
     Furthermore, we can always add attributes and maintain backwards compatibility."""
 
+    # No per-instance __dict__, as we create one of these per node (E.G. list_available_variables)
+    __slots__ = (
+        "name",
+        "type",
+        "tags",
+        "is_external_input",
+        "originating_functions",
+        "documentation",
+        "required_dependencies",
+        "optional_dependencies",
+        "_version",  # lazily computed, see `version`
+    )
+
     name: str
     type: typing.Type
     tags: typing.Dict[str, typing.Union[str, typing.List[str]]]
@@ -144,7 +157,7 @@ class HamiltonNode:
             },
         )
 
-    @functools.cached_property
+    @property
     def version(self) -> typing.Optional[str]:
         """Generate a hash of the node originating function source code.
 
@@ -153,7 +166,16 @@ class HamiltonNode:
 
         The option `strip=True` means docstring and comments are ignored
         when hashing the function.
+
+        This is computed on first access, and cached.
         """
+        try:
+            return self._version
+        except AttributeError:
+            self._version = self._compute_version()
+            return self._version
+
+    def _compute_version(self) -> typing.Optional[str]:
         if self.originating_functions is None or len(self.originating_functions) == 0:
             if self.is_external_input:
                 # return the name of the config node. (we could add type but skipping for now)
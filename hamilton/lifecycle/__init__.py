@@ -14,6 +14,7 @@ from .base import LifecycleAdapter  # noqa: F401
 from .default import (  # noqa: F401
     FunctionInputOutputTypeChecker,
     GracefulErrorAdapter,
+    MemoryProfiler,
     PDBDebugger,
     PrintLn,
     SlowDownYouMoveTooFast,
@@ -39,4 +40,5 @@ __all__ = [
     "StaticValidator",
     "TaskExecutionHook",
     "FunctionInputOutputTypeChecker",
+    "MemoryProfiler",
 ]
@@ -1,4 +1,5 @@
 import abc
+import weakref
 from abc import ABC
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional, Tuple, Type, final
@@ -40,6 +41,30 @@ except ImportError:
     override = lambda x: x  # noqa E731
 
 
+# Result builder class -> whether it builds results from dicts. Weak, so classes can be collected
+_builds_result_from_dict_cache = weakref.WeakKeyDictionary()
+
+
+def _builds_result_from_dict(cls: type) -> bool:
+    """Whether build_result_from_dict is as specific as build_result for this class -- I.E. it was
+    not inherited from a superclass of the one that overrides build_result.
+
+    :param cls: Result builder class
+    :return: True if we can call build_result_from_dict in place of build_result
+    """
+    builds_from_dict = _builds_result_from_dict_cache.get(cls)
+    if builds_from_dict is None:
+
+        def defined_by(attribute: str) -> type:
+            return next(klass for klass in cls.__mro__ if attribute in vars(klass))
+
+        builds_from_dict = issubclass(
+            defined_by("build_result_from_dict"), defined_by("build_result")
+        )
+        _builds_result_from_dict_cache[cls] = builds_from_dict
+    return builds_from_dict
+
+
 class ResultBuilder(BaseDoBuildResult, abc.ABC):
     """Abstract class for building results. All result builders should inherit from this class and implement the build_result function.
     Note that applicable_input_type and output_type are optional, but recommended, for backwards
@@ -55,12 +80,26 @@ class ResultBuilder(BaseDoBuildResult, abc.ABC):
         """
         pass
 
+    def build_result_from_dict(self, outputs: Dict[str, Any]) -> Any:
+        """Same as build_result, but takes the outputs as a dict rather than as keyword arguments.
+        Override this alongside build_result to avoid unpacking (and repacking) the outputs, which
+        adds up when a lot of outputs are requested. This is only used if it is defined on the same
+        class as (or a subclass of the one defining) build_result, so overriding build_result alone
+        remains safe.
+
+        :param outputs: the outputs from the execution of the graph.
+        :return: the result of the execution of the graph.
+        """
+        return self.build_result(**outputs)
+
     @override
     @final
     def do_build_result(self, outputs: Dict[str, Any]) -> Any:
         """Implements the do_build_result method from the BaseDoBuildResult class.
         This is kept from the user as the public-facing API is build_result, allowing us to change the
         API/implementation of the internal set of hooks"""
+        if _builds_result_from_dict(type(self)):
+            return self.build_result_from_dict(outputs)
         return self.build_result(**outputs)
 
     def input_types(self) -> List[Type[Type]]:
@@ -280,6 +280,10 @@ class BaseDoCheckEdgeTypesMatch(abc.ABC):
 
 @lifecycle.base_method("do_validate_input")
 class BaseDoValidateInput(abc.ABC):
+    # Set to True if `do_validate_input` only depends on `type(input_value)` (and not the value itself).
+    # This lets the driver cache validation results per (node type, input type) pair.
+    input_validation_cacheable: bool = False
+
     @abc.abstractmethod
     def do_validate_input(self, *, node_type: type, input_value: Any) -> bool:
         """Method that an input value maches an expected type.
@@ -921,6 +925,15 @@ class LifecycleAdapterSet:
         :param kwargs: Keyword arguments to pass into the method
         :return: The result of the method
         """
+        return self.get_lifecycle_method_sync(method_name)(**kwargs)
+
+    def get_lifecycle_method_sync(self, method_name: str) -> Callable[..., Any]:
+        """Gets a lifecycle method in this group, by method name, bound to the adapter implementing it.
+        Use this over `call_lifecycle_method_sync` to resolve it once when calling it in a loop.
+
+        :param method_name: Name of the method
+        :return: The method, to be called with keyword arguments
+        """
         if method_name not in REGISTERED_SYNC_METHODS:
             raise ValueError(
                 f"Method {method_name} is not registered as a synchronous lifecycle method. "
@@ -932,7 +945,7 @@ class LifecycleAdapterSet:
                 f"Registered methods are {self.sync_methods}"
             )
         (adapter,) = self.sync_methods[method_name]
-        return getattr(adapter, method_name)(**kwargs)
+        return getattr(adapter, method_name)
 
     async def call_lifecycle_method_async(self, method_name: str, **kwargs):
         """Call a lifecycle method in this group, by method name, async
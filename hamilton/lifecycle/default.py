@@ -7,9 +7,13 @@ import pickle
 import pprint
 import random
 import shelve
+import sys
 import time
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 
+import numpy as np
+import pandas as pd
+
 from hamilton import graph_types, htypes
 from hamilton.graph_types import HamiltonGraph
 from hamilton.lifecycle import GraphExecutionHook, NodeExecutionHook, NodeExecutionMethod
@@ -509,6 +513,101 @@ class FunctionInputOutputTypeChecker(NodeExecutionHook):
                 )
 
 
+def estimate_size(value: Any) -> int:
+    """Estimates how much memory a value takes up, in bytes.
+    Uses `.memory_usage(deep=True)` for pandas objects, `.nbytes` for numpy arrays, and
+    `sys.getsizeof` for everything else (which does not count what it references). Lazy objects
+    (E.G. dask dataframes) are never computed.
+
+    :param value: Value to estimate the size of
+    :return: Size, in bytes
+    """
+    memory_usage = getattr(value, "memory_usage", None)
+    if callable(memory_usage):
+        try:
+            usage = memory_usage(deep=True)
+        except Exception:
+            usage = None  # not what we thought it was
+        # Only trust concrete results -- summing a lazy one (E.G. from dask) would compute it
+        if isinstance(usage, pd.Series):  # dataframes return the usage per column
+            return int(usage.sum())
+        if isinstance(usage, (int, np.integer)):
+            return int(usage)
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    return sys.getsizeof(value)
+
+
+class MemoryProfiler(NodeExecutionHook, GraphExecutionHook):
+    """Records the (estimated) size of every node's result, and logs the largest ones once the
+    graph has executed. Use this to find the intermediates that drive peak memory.
+
+    .. code-block:: python
+
+        profiler = MemoryProfiler(top_k=5)
+        dr = driver.Builder().with_modules(my_module).with_adapters(profiler).build()
+        dr.execute(["output"])
+        profiler.memory_records  # node name -> size in bytes, for the last execution
+
+    Sizes are estimated with `estimate_size`. Note this can be slow for large columns of python
+    objects (E.G. strings), as pandas has to inspect every value.
+
+    Records are reset at the start of every execution, so one instance is not safe to share
+    between concurrent executes -- use one per driver/thread if you execute concurrently.
+    """
+
+    def __init__(self, top_k: int = 10, log_fn: Callable[[str], None] = logger.info):
+        """Constructor.
+
+        :param top_k: Number of nodes to log, largest first.
+        :param log_fn: Function to log the report with -- defaults to logging at the info level.
+        """
+        self.top_k = top_k
+        self.log_fn = log_fn
+        self.memory_records: Dict[str, int] = {}
+
+    def run_before_graph_execution(self, **future_kwargs: Any):
+        """Clears the records of the previous execution"""
+        self.memory_records = {}
+
+    def run_before_node_execution(self, **future_kwargs: Any):
+        """Does nothing"""
+        pass
+
+    def run_after_node_execution(
+        self,
+        *,
+        node_name: str,
+        result: Any,
+        success: bool,
+        task_id: Optional[str] = None,
+        **future_kwargs: Any,
+    ):
+        """Records the size of the node's result.
+
+        :param node_name: Name of the node
+        :param result: Result of the node
+        :param success: Whether the node was successful or not
+        :param task_id: ID of the task that the node is in, if any
+        :param future_kwargs: Additional keyword arguments that may be passed to the hook yet are ignored for now
+        """
+        if not success:
+            return
+        node_unique_id = PrintLn._format_node_name(node_name, task_id)
+        self.memory_records[node_unique_id] = estimate_size(result)
+
+    def run_after_graph_execution(self, **future_kwargs: Any):
+        """Logs the largest results of the execution"""
+        largest = sorted(self.memory_records.items(), key=lambda item: item[1], reverse=True)
+        if not largest:
+            return
+        self.log_fn(
+            "Top intermediates by size:\n"
+            + "\n".join(f"{name}: {size:,} bytes" for name, size in largest[: self.top_k])
+        )
+
+
 SENTINEL_DEFAULT = None  # sentinel value -- lazy for now
 INJECTION_ALLOWED = "injection is requested"
 
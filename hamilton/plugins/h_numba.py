@@ -0,0 +1,141 @@
+import logging
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from hamilton import graph
+from hamilton.lifecycle import base as lifecycle_base
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numba
+except ImportError:
+    # Functions marked as compilable are plain python functions, so they still work without numba
+    numba = None
+
+NUMBA_COMPILABLE_ATTRIBUTE = "__hamilton_numba_compilable__"
+
+
+def compilable(signature: Optional[Union[str, Any]] = None) -> Callable[[Callable], Callable]:
+    """Marks a function as safe to compile with numba (`numba.njit`). The function itself is
+    not changed -- compilation happens when the driver is built with the `NumbaCompiler` adapter.
+
+    Only mark functions that numba can compile in nopython mode, I.E. ones that take in and
+    return numpy arrays/scalars.
+
+    .. code-block:: python
+
+        from hamilton.plugins import h_numba
+
+        @h_numba.compilable("float64[:](float64[:], float64)")
+        def scaled(raw: np.ndarray, factor: float) -> np.ndarray:
+            return raw * factor
+
+    :param signature: Optional numba signature. If provided, the function is compiled eagerly when
+        the driver is built (and numba skips type inference). Otherwise it is compiled on first call.
+    :return: A decorator that marks the function.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        setattr(fn, NUMBA_COMPILABLE_ATTRIBUTE, {"signature": signature})
+        return fn
+
+    return decorator
+
+
+class NumbaCompiler(lifecycle_base.BasePostGraphConstruct):
+    """Adapter that compiles functions marked with `@h_numba.compilable` with numba when the
+    driver is built, and swaps them in for the node's callable. This way the cost of compilation
+    is paid once, up-front, and every subsequent `.execute()` runs native code.
+
+    If numba is not installed, or a function fails to compile, this logs a warning and leaves the
+    nodes as they are.
+
+    .. code-block:: python
+
+        from hamilton import driver
+        from hamilton.plugins import h_numba
+
+        dr = (
+            driver.Builder()
+            .with_modules(my_numeric_module)
+            .with_adapters(h_numba.NumbaCompiler())
+            .build()
+        )
+
+    Note that nodes whose callables are transformed by other function modifiers (E.G. `@check_output`,
+    `@extract_columns`) are left alone, as the function numba would compile is not the one that
+    gets called.
+    """
+
+    def __init__(self, cache: bool = True, boundscheck: bool = False, **njit_kwargs: Any):
+        """Creates the numba compiler.
+
+        :param cache: Whether numba should cache compiled functions on disk, across processes.
+            Functions numba can't cache (E.G. ones without a source file) are compiled without it.
+        :param boundscheck: Whether to check array bounds. Off by default, as it is in numba.
+        :param njit_kwargs: Any other keyword arguments to pass to `numba.njit`.
+        """
+        self.njit_kwargs = dict(cache=cache, boundscheck=boundscheck, **njit_kwargs)
+        self._compiled: Dict[Callable, Callable] = {}
+
+    def _jit(self, fn: Callable, **njit_kwargs: Any) -> Callable:
+        signature = getattr(fn, NUMBA_COMPILABLE_ATTRIBUTE)["signature"]
+        if signature is not None:
+            return numba.njit(signature, **njit_kwargs)(fn)
+        return numba.njit(**njit_kwargs)(fn)
+
+    def _compile(self, fn: Callable) -> Callable:
+        if fn not in self._compiled:
+            try:
+                compiled = self._jit(fn, **self.njit_kwargs)
+            except RuntimeError:
+                if not self.njit_kwargs.get("cache"):
+                    raise
+                # numba can only cache functions it can locate the source file of -- not, E.G.
+                # functions defined in exec'd code or notebooks
+                logger.debug(f"Unable to cache {fn.__qualname__} with numba, compiling without it.")
+                compiled = self._jit(fn, **{**self.njit_kwargs, "cache": False})
+            self._compiled[fn] = compiled
+        return self._compiled[fn]
+
+    def post_graph_construct(
+        self,
+        *,
+        graph: "graph.FunctionGraph",
+        modules: List[ModuleType],
+        config: Dict[str, Any],
+    ):
+        """Compiles all marked functions and swaps them in as the node callables.
+
+        :param graph: Graph that has been constructed.
+        :param modules: Modules passed into the graph
+        :param config: Config passed into the graph
+        """
+        for node_ in graph.nodes.values():
+            if node_.user_defined or not node_.originating_functions:
+                continue
+            fn = node_.originating_functions[0]
+            if not hasattr(fn, NUMBA_COMPILABLE_ATTRIBUTE):
+                continue
+            if node_.callable is self._compiled.get(fn):
+                continue  # already compiled, E.G. the graph was modified for materialization
+            if node_.callable is not fn:
+                logger.warning(
+                    f"Not compiling node {node_.name} with numba: it is produced by a function "
+                    f"modifier on {fn.__qualname__}, so its callable is not the original function."
+                )
+                continue
+            if numba is None:
+                logger.warning(
+                    "numba is not installed -- functions marked with @h_numba.compilable will run "
+                    "as plain python. Install it with `pip install numba` to compile them."
+                )
+                return
+            try:
+                node_._callable = self._compile(fn)
+            except Exception as e:
+                logger.warning(
+                    f"Not compiling node {node_.name} with numba, it will run as plain python. "
+                    f"Compiling {fn.__qualname__} failed with: {e}"
+                )
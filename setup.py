@@ -80,6 +80,7 @@ setup(
         ],
         "pandera": ["pandera"],
         "slack": ["slack-sdk"],
+        "numba": ["numba"],
         "tqdm": ["tqdm"],
         "datadog": ["ddtrace"],
         "vaex": [
@@ -1,14 +1,24 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Union
 
 import pytest
 
-from hamilton import node
+from hamilton import ad_hoc_utils, graph, node
 from hamilton.execution.graph_functions import (
+    compile_execution_plan,
+    compute_bottom_levels,
     create_input_string,
+    create_parallel_execution_plan,
+    execute_parallel_execution_plan,
+    execute_subdag_in_parallel,
     nodes_between,
     topologically_sort_nodes,
 )
 
+import tests.resources.cyclic_functions
+import tests.resources.dummy_functions
+
 
 def _create_dummy_dag(
     adjacency_map: Dict[str, List[str]], dict_output: bool = False
@@ -155,6 +165,23 @@ def test_find_nodes_between(dag_repr, expected_nodes_in_between, start_node, end
     assert set(in_between) == {nodes[item] for item in expected_nodes_in_between}
 
 
+def test_compute_bottom_levels():
+    nodes = _create_dummy_dag({"a": [], "b": ["a"], "c": ["b"], "d": ["a"], "e": ["c", "d"]})
+    assert compute_bottom_levels(nodes) == {"a": 4, "b": 3, "c": 2, "d": 2, "e": 1}
+
+
+def test_compute_bottom_levels_with_cost_fn():
+    nodes = _create_dummy_dag({"a": [], "b": ["a"], "c": ["b"], "d": ["a"], "e": ["c", "d"]})
+    costs = {"a": 1, "b": 1, "c": 1, "d": 10, "e": 1}
+    bottom_levels = compute_bottom_levels(nodes, lambda node_: costs[node_.name])
+    assert bottom_levels == {"a": 12, "b": 3, "c": 2, "d": 11, "e": 1}
+
+
+def test_compute_bottom_levels_only_counts_passed_in_nodes():
+    nodes = _create_dummy_dag({"a": [], "b": ["a"], "c": ["b"]})
+    assert compute_bottom_levels(nodes[:2]) == {"a": 2, "b": 1}
+
+
 def test_create_input_string_with_short_values():
     """Tests that create_input_string works correctly with short values"""
     kwargs = {"arg1": 1, "arg2": "short string", "arg3": 3.14}
@@ -221,3 +248,249 @@ def test_create_input_string_with_custom_object():
         " 'arg2': 'short string',\n"
         " 'arg3': 3.14}"
     )
+
+
+def _all_upstream_nodes(fg: graph.FunctionGraph, final_vars: List[str], **kwargs) -> set:
+    nodes, user_nodes = fg.get_upstream_nodes(final_vars, **kwargs)
+    return nodes | user_nodes
+
+
+def test_execute_subdag_in_parallel():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={})
+    inputs = {"b": 1, "c": 2}
+    nodes = _all_upstream_nodes(fg, ["B", "C"], runtime_inputs=inputs)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        computed = execute_subdag_in_parallel(nodes, inputs, pool)
+    assert computed["B"] == 9
+    assert computed["C"] == 6
+
+
+def test_execute_subdag_in_parallel_with_overrides():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={})
+    overrides = {"A": 10}
+    nodes = _all_upstream_nodes(fg, ["B"], runtime_inputs={}, runtime_overrides=overrides)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        computed = execute_subdag_in_parallel(nodes, {}, pool, overrides=overrides)
+    assert computed["B"] == 100
+
+
+def test_execute_subdag_in_parallel_runs_independent_nodes_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def left(source: int) -> int:
+        barrier.wait()  # only passes if right() is running at the same time
+        return source + 1
+
+    def right(source: int) -> int:
+        barrier.wait()
+        return source + 2
+
+    def joined(left: int, right: int) -> int:
+        return left + right
+
+    module = ad_hoc_utils.create_temporary_module(left, right, joined)
+    fg = graph.FunctionGraph.from_modules(module, config={})
+    inputs = {"source": 1}
+    nodes = _all_upstream_nodes(fg, ["joined"], runtime_inputs=inputs)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        computed = execute_subdag_in_parallel(nodes, inputs, pool)
+    assert computed["joined"] == 5
+
+
+def test_execute_subdag_in_parallel_raises_on_failure():
+    def fails(source: int) -> int:
+        raise ValueError("boom")
+
+    def downstream(fails: int) -> int:
+        return fails
+
+    module = ad_hoc_utils.create_temporary_module(fails, downstream)
+    fg = graph.FunctionGraph.from_modules(module, config={})
+    inputs = {"source": 1}
+    nodes = _all_upstream_nodes(fg, ["downstream"], runtime_inputs=inputs)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        with pytest.raises(ValueError, match="boom"):
+            execute_subdag_in_parallel(nodes, inputs, pool)
+
+
+def test_execute_subdag_in_parallel_detects_cycles():
+    fg = graph.FunctionGraph.from_modules(tests.resources.cyclic_functions, config={})
+    inputs = {"b": 2, "c": 2}
+    nodes = _all_upstream_nodes(fg, ["C"], runtime_inputs=inputs)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        with pytest.raises(ValueError, match="cycles"):
+            execute_subdag_in_parallel(nodes, inputs, pool)
+
+
+def test_execute_subdag_in_parallel_submits_critical_path_first():
+    execution_order = []
+
+    def long_1(source: int) -> int:
+        execution_order.append("long_1")
+        return source
+
+    def long_2(long_1: int) -> int:
+        execution_order.append("long_2")
+        return long_1
+
+    def long_3(long_2: int) -> int:
+        execution_order.append("long_3")
+        return long_2
+
+    def short(source: int) -> int:
+        execution_order.append("short")
+        return source
+
+    def joined(long_3: int, short: int) -> int:
+        return long_3 + short
+
+    module = ad_hoc_utils.create_temporary_module(long_1, long_2, long_3, short, joined)
+    fg = graph.FunctionGraph.from_modules(module, config={})
+    inputs = {"source": 1}
+    nodes = _all_upstream_nodes(fg, ["joined"], runtime_inputs=inputs)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        computed = execute_subdag_in_parallel(
+            nodes,
+            inputs,
+            pool,
+            max_concurrency=1,
+            priorities=compute_bottom_levels(nodes),
+        )
+    assert computed["joined"] == 2
+    assert execution_order[0] == "long_1"
+
+
+def test_execute_subdag_in_parallel_releases_intermediates():
+    released = set()
+
+    class Tracked:
+        def __init__(self, name: str):
+            self.name = name
+
+        def __del__(self):
+            released.add(self.name)
+
+    def first(source: int) -> Tracked:
+        return Tracked("first")
+
+    def second(first: Tracked) -> Tracked:
+        # the output of first() should be released once it's handed to us
+        assert "first" not in released
+        return Tracked("second")
+
+    def third(second: Tracked) -> int:
+        assert "first" in released
+        return 3
+
+    module = ad_hoc_utils.create_temporary_module(first, second, third)
+    fg = graph.FunctionGraph.from_modules(module, config={})
+    inputs = {"source": 1}
+    nodes = _all_upstream_nodes(fg, ["third"], runtime_inputs=inputs)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        computed = execute_subdag_in_parallel(nodes, inputs, pool, retain=["third"])
+    assert computed == {"third": 3}
+
+
+def test_execute_subdag_in_parallel_retains_all_by_default():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={})
+    inputs = {"b": 1, "c": 2}
+    nodes = _all_upstream_nodes(fg, ["B"], runtime_inputs=inputs)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        computed = execute_subdag_in_parallel(nodes, inputs, pool)
+    assert computed == {"b": 1, "c": 2, "A": 3, "B": 9}
+
+
+def test_create_parallel_execution_plan():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={})
+    nodes = _all_upstream_nodes(fg, ["B", "C"], runtime_inputs={"b": 1, "c": 2})
+    plan = create_parallel_execution_plan(nodes, retain=["B", "C"])
+    assert [node_.name for node_ in plan.nodes] == ["A", "B", "C", "b", "c"]
+    assert plan.dependencies == [[(3, "b"), (4, "c")], [(0, "A")], [(0, "A")], [], []]
+    assert plan.dependents == [[1, 2], [], [], [0], [0]]
+    assert plan.in_degrees == [2, 1, 1, 0, 0]
+    assert plan.retained == [False, True, True, False, False]
+    assert plan.consumer_counts == [2, 0, 0, 1, 1]
+
+
+def test_create_parallel_execution_plan_with_overrides():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={})
+    nodes = _all_upstream_nodes(fg, ["B"], runtime_inputs={}, runtime_overrides={"A": 10})
+    plan = create_parallel_execution_plan(nodes, override_names=["A"])
+    assert [node_.name for node_ in plan.nodes] == ["A", "B"]
+    assert plan.in_degrees == [0, 1]
+    assert plan.retained is None
+
+
+def test_execute_parallel_execution_plan_reuses_plan():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={})
+    nodes = _all_upstream_nodes(fg, ["B"], runtime_inputs={"b": 1, "c": 2})
+    plan = create_parallel_execution_plan(nodes, retain=["B"])
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = execute_parallel_execution_plan(plan, {"b": 1, "c": 2}, pool)
+        second = execute_parallel_execution_plan(plan, {"b": 2, "c": 2}, pool)
+    assert first == {"B": 9}
+    assert second == {"B": 16}
+    # executing does not mutate the plan
+    assert plan.in_degrees == [2, 1, 0, 0]
+    assert plan.consumer_counts == [1, 0, 1, 1]
+
+
+def test_execute_parallel_execution_plan_records_timings():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={})
+    nodes = _all_upstream_nodes(fg, ["B"], runtime_inputs={"b": 1, "c": 2})
+    plan = create_parallel_execution_plan(nodes, retain=["B"])
+    timings = {}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert execute_parallel_execution_plan(plan, {"b": 1, "c": 2}, pool, timings=timings) == {
+            "B": 9
+        }
+    # only nodes that were run get timed -- not inputs
+    assert set(timings) == {"A", "B"}
+    assert all(seconds >= 0 for seconds in timings.values())
+
+
+def test_compile_execution_plan():
+    fg = graph.FunctionGraph.from_modules(tests.resources.dummy_functions, config={"b": 1})
+    nodes = _all_upstream_nodes(fg, ["B", "C"])
+    plan = compile_execution_plan(nodes, ["B", "C"], fg.config)
+    assert plan({"c": 2}) == {"B": 9, "C": 6}
+    assert plan({"c": 3}) == {"B": 16, "C": 8}
+    with pytest.raises(ValueError):
+        plan({})
+    with pytest.raises(ValueError, match="mutually disjoint"):
+        # config can't be overridden by inputs, same as when executing
+        plan({"b": 100, "c": 2})
+
+
+def test_compile_execution_plan_non_identifier_names():
+    a = node.Node("a.b", int, node_source=node.NodeType.EXTERNAL)
+    doubled = node.Node(
+        "doubled",
+        int,
+        callabl=lambda **kwargs: kwargs["a.b"] * 2,
+        input_types={"a.b": (int, node.DependencyType.REQUIRED)},
+    )
+    doubled._dependencies = [a]
+    a._depended_on_by = [doubled]
+    plan = compile_execution_plan([a, doubled], ["doubled"], {})
+    assert plan({"a.b": 2}) == {"doubled": 4}
+
+
+def test_compile_execution_plan_names_cannot_inject_code():
+    a = node.Node("a\nraise ValueError()", int, node_source=node.NodeType.EXTERNAL)
+    doubled = node.Node(
+        "doubled\nraise ValueError()",
+        int,
+        callabl=lambda **kwargs: kwargs["a\nraise ValueError()"] * 2,
+        input_types={"a\nraise ValueError()": (int, node.DependencyType.REQUIRED)},
+    )
+    doubled._dependencies = [a]
+    a._depended_on_by = [doubled]
+    plan = compile_execution_plan([a, doubled], [doubled.name], {a.name: 2})
+    assert plan({}) == {doubled.name: 4}
+
+
+def test_compile_execution_plan_detects_cycles():
+    fg = graph.FunctionGraph.from_modules(tests.resources.cyclic_functions, config={})
+    with pytest.raises(ValueError):
+        compile_execution_plan(fg.get_nodes(), ["B"], {})
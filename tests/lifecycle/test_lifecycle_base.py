@@ -294,6 +294,11 @@ def test_lifecycle_adapter_set_with_single_multi_method():
     assert len(multi_hook.calls) == 1
     adapter_set.call_lifecycle_method_sync("do_validate_input", node_type=None, input_value=None)
     assert len(multi_hook.calls) == 2
+    do_validate_input = adapter_set.get_lifecycle_method_sync("do_validate_input")
+    assert do_validate_input(node_type=None, input_value=None)
+    assert len(multi_hook.calls) == 3
+    with pytest.raises(ValueError):
+        adapter_set.get_lifecycle_method_sync("do_build_result")
 
 
 def test_lifecycle_adapter_set_with_multiple_validators():
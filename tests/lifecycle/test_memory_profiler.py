@@ -0,0 +1,63 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from hamilton import ad_hoc_utils, driver
+from hamilton.lifecycle.default import MemoryProfiler, estimate_size
+
+
+def test_estimate_size():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    assert estimate_size(df) == df.memory_usage(deep=True).sum()
+    assert estimate_size(df["b"]) == df["b"].memory_usage(deep=True)
+    assert estimate_size(np.zeros(10)) == 80
+    assert estimate_size("hello") == sys.getsizeof("hello")
+
+
+class _LazyUsage:
+    def sum(self):
+        raise AssertionError("Should not compute lazy memory usage")
+
+
+class _LazyFrame:
+    def memory_usage(self, deep: bool = False):
+        return _LazyUsage()
+
+
+def test_estimate_size_does_not_compute_lazy_objects():
+    lazy_frame = _LazyFrame()
+    assert estimate_size(lazy_frame) == sys.getsizeof(lazy_frame)
+
+
+def small() -> int:
+    return 1
+
+
+def large(small: int) -> pd.DataFrame:
+    return pd.DataFrame({"a": range(1000)})
+
+
+def medium(small: int) -> np.ndarray:
+    return np.zeros(10)
+
+
+def test_memory_profiler_logs_largest_results():
+    messages = []
+    profiler = MemoryProfiler(top_k=2, log_fn=messages.append)
+    dr = (
+        driver.Builder()
+        .with_modules(ad_hoc_utils.create_temporary_module(small, large, medium))
+        .with_adapters(profiler)
+        .build()
+    )
+    dr.execute(["large", "medium"])
+    assert set(profiler.memory_records) == {"small", "large", "medium"}
+    assert profiler.memory_records["medium"] == 80
+    assert len(messages) == 1
+    report = messages[0].splitlines()
+    assert report[0] == "Top intermediates by size:"
+    assert [line.split(":")[0] for line in report[1:]] == ["large", "medium"]
+    # records are reset on every execution
+    dr.execute(["small"])
+    assert set(profiler.memory_records) == {"small"}
@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+
+from hamilton import ad_hoc_utils, driver
+from hamilton.function_modifiers import check_output
+from hamilton.plugins import h_numba
+
+numba = pytest.importorskip("numba")
+
+
+@h_numba.compilable()
+def scaled(raw: np.ndarray, factor: float) -> np.ndarray:
+    return raw * factor
+
+
+@h_numba.compilable("float64(float64[:])")
+def total(scaled: np.ndarray) -> float:
+    result = 0.0
+    for value in scaled:
+        result += value
+    return result
+
+
+def not_compiled(total: float) -> float:
+    return total + 1
+
+
+@h_numba.compilable()
+@check_output(range=(0, 100))
+def checked(total: float) -> float:
+    return total
+
+
+def _build_driver() -> driver.Driver:
+    module = ad_hoc_utils.create_temporary_module(scaled, total, not_compiled, checked)
+    return (
+        driver.Builder()
+        .with_modules(module)
+        .with_adapters(h_numba.NumbaCompiler(cache=False))
+        .build()
+    )
+
+
+def test_numba_compiler_swaps_in_compiled_callables():
+    dr = _build_driver()
+    assert isinstance(dr.graph.nodes["scaled"].callable, numba.core.registry.CPUDispatcher)
+    assert isinstance(dr.graph.nodes["total"].callable, numba.core.registry.CPUDispatcher)
+    node_ = dr.graph.nodes["not_compiled"]
+    assert node_.callable is node_.originating_functions[0]
+
+
+def test_numba_compiler_compiles_eagerly_with_signature():
+    dr = _build_driver()
+    # signature was provided, so this is compiled at driver build time
+    assert len(dr.graph.nodes["total"].callable.signatures) == 1
+    # no signature, so this compiles lazily
+    assert len(dr.graph.nodes["scaled"].callable.signatures) == 0
+
+
+def test_numba_compiler_skips_transformed_nodes():
+    dr = _build_driver()
+    assert not isinstance(dr.graph.nodes["checked"].callable, numba.core.registry.CPUDispatcher)
+
+
+def test_numba_compiler_executes():
+    dr = _build_driver()
+    result = dr.execute(
+        ["not_compiled", "checked"],
+        inputs={"raw": np.array([1.0, 2.0, 3.0]), "factor": 2.0},
+    )
+    assert result == {"not_compiled": 13.0, "checked": 12.0}
+
+
+def test_numba_compiler_without_numba(monkeypatch):
+    monkeypatch.setattr(h_numba, "numba", None)
+    dr = _build_driver()
+    node_ = dr.graph.nodes["scaled"]
+    assert node_.callable is node_.originating_functions[0]
+    result = dr.execute(["total"], inputs={"raw": np.array([1.0, 2.0]), "factor": 1.0})
+    assert result == {"total": 3.0}
+
+
+def test_numba_compiler_default_cache_without_source_file():
+    module = ad_hoc_utils.module_from_source(
+        "import numpy as np\n"
+        "from hamilton.plugins import h_numba\n"
+        "\n"
+        "@h_numba.compilable('float64(float64[:])')\n"
+        "def total(raw: np.ndarray) -> float:\n"
+        "    return raw.sum()\n"
+    )
+    # numba cannot cache functions from exec'd source, so this compiles without caching
+    dr = driver.Builder().with_modules(module).with_adapters(h_numba.NumbaCompiler()).build()
+    assert isinstance(dr.graph.nodes["total"].callable, numba.core.registry.CPUDispatcher)
+    assert dr.execute(["total"], inputs={"raw": np.array([1.0, 2.0])}) == {"total": 3.0}
+
+
+def test_numba_compiler_falls_back_when_compilation_fails():
+    @h_numba.compilable("float64(float64[:])")
+    def unsupported(raw: np.ndarray) -> float:
+        object()  # numba cannot compile arbitrary python objects
+        return raw.sum()
+
+    module = ad_hoc_utils.create_temporary_module(unsupported)
+    dr = (
+        driver.Builder()
+        .with_modules(module)
+        .with_adapters(h_numba.NumbaCompiler(cache=False))
+        .build()
+    )
+    node_ = dr.graph.nodes["unsupported"]
+    assert node_.callable is node_.originating_functions[0]
+    assert dr.execute(["unsupported"], inputs={"raw": np.array([1.0])}) == {"unsupported": 1.0}
@@ -1,5 +1,8 @@
 import collections
+import gc
 import typing
+import weakref
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -7,6 +10,7 @@ import pytest
 from numpy import testing
 
 from hamilton import base
+from hamilton.lifecycle import api as lifecycle_api
 
 
 def test_numpymatrixresult_int():
@@ -490,3 +494,55 @@ def test_StrictIndexTypePandasDataFrameResult_build_result_errors(outputs):
     sitpdfr = base.StrictIndexTypePandasDataFrameResult()
     with pytest.raises(ValueError):
         sitpdfr.build_result(**outputs)
+
+
+def test_DictResult_do_build_result_skips_unpacking():
+    outputs = {"a": 1, "b": 2}
+    with mock.patch.object(base.DictResult, "build_result") as build_result:
+        result = base.DictResult().do_build_result(outputs=outputs)
+    build_result.assert_not_called()
+    assert result == outputs
+    assert result is not outputs  # callers can mutate it without affecting anyone else
+
+
+def test_do_build_result_does_not_keep_result_builder_classes_alive():
+    class LocalResult(base.DictResult):
+        pass
+
+    assert LocalResult().do_build_result(outputs={"a": 1}) == {"a": 1}
+    assert LocalResult in lifecycle_api._builds_result_from_dict_cache
+    class_ref = weakref.ref(LocalResult)
+    del LocalResult
+    gc.collect()
+    assert class_ref() is None
+
+
+def test_SimplePythonGraphAdapter_do_build_result_delegates():
+    outputs = {"a": pd.Series([1, 2]), "b": pd.Series([3, 4])}
+    adapter = base.SimplePythonGraphAdapter(base.PandasDataFrameResult())
+    pd.testing.assert_frame_equal(adapter.do_build_result(outputs=outputs), pd.DataFrame(outputs))
+    result = base.DefaultAdapter().do_build_result(outputs=outputs)
+    assert list(result) == ["a", "b"]
+    assert result is not outputs
+
+
+def test_do_build_result_uses_overridden_build_result():
+    """Subclasses that only override build_result should not be bypassed by the dict form."""
+
+    class StrictResult(base.StrictIndexTypePandasDataFrameResult):
+        pass
+
+    class CountingDictResult(base.DictResult):
+        @staticmethod
+        def build_result(**outputs: typing.Dict[str, typing.Any]) -> typing.Dict:
+            return {"count": len(outputs)}
+
+    outputs = {
+        "series1": pd.Series([1, 2, 3], index=[1, 2, 3]),
+        "series2": pd.Series([4, 5, 6], index=[1.0, 2.0, 3.0]),
+    }
+    with pytest.raises(ValueError):
+        StrictResult().do_build_result(outputs=outputs)
+    assert CountingDictResult().do_build_result(outputs=outputs) == {"count": 2}
+    adapter = base.SimplePythonGraphAdapter(CountingDictResult())
+    assert adapter.do_build_result(outputs=outputs) == {"count": 2}
@@ -136,6 +136,19 @@ def test_create_hamilton_node_missing_version():
     assert hamilton_node.as_dict()["version"] is None
 
 
+def test_hamilton_node_has_no_instance_dict():
+    def foo(i: int) -> int:
+        return i
+
+    n = node.Node.from_fn(foo).copy_with(originating_functions=(foo,))
+    hamilton_node = graph_types.HamiltonNode.from_node(n)
+    assert not hasattr(hamilton_node, "__dict__")
+    assert hamilton_node.version == graph_types.hash_source_code(foo, strip=True)
+    # computed once, then cached
+    assert hamilton_node.version is hamilton_node.version
+    assert hamilton_node == graph_types.HamiltonNode.from_node(n)
+
+
 def test_hamilton_graph_version_normal():
     dr = driver.Builder().with_modules(no_parallel).build()
     graph = graph_types.HamiltonGraph.from_graph(dr.graph)
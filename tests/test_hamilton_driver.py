@@ -1,18 +1,23 @@
+import warnings
+from typing import Any
 from unittest import mock
 
 import pandas as pd
 import pytest
 
-from hamilton import base, node
+from hamilton import base, htypes, node
 from hamilton.driver import (
     Builder,
     Driver,
     InvalidExecutorException,
+    ParallelGraphExecutor,
     TaskBasedGraphExecutor,
     Variable,
+    _warn_display_graph_deprecated,
 )
-from hamilton.execution import executors
+from hamilton.execution import executors, graph_functions
 from hamilton.io.materialization import from_, to
+from hamilton.lifecycle import base as lifecycle_base
 
 import tests.resources.cyclic_functions
 import tests.resources.dummy_functions
@@ -41,6 +46,7 @@ TODO -- move any execution tests to tests the graph executor capabilities on the
             .with_config({"a": 1})
             .build()
         ),
+        (lambda: Builder().enable_parallel_node_execution().with_config({"a": 1}).build()),
     ],
 )
 def test_driver_validate_input_types(driver_factory):
@@ -60,6 +66,12 @@ def test_driver_validate_input_types(driver_factory):
             .with_remote_executor(executors.SynchronousLocalTaskExecutor())
             .build()
         ),
+        (
+            lambda: Builder()
+            .enable_parallel_node_execution()
+            .with_modules(tests.resources.very_simple_dag)
+            .build()
+        ),
     ],
 )
 def test_driver_validate_runtime_input_types(driver_factory):
@@ -166,6 +178,16 @@ def test_driver_variables_filters_tags(filter, expected):
     assert actual == expected
 
 
+def test_driver_iter_available_variables():
+    dr = Driver({}, tests.resources.tagging)
+    variables = dr.iter_available_variables(tag_filter={"test": "b_c"})
+    assert not isinstance(variables, list)
+    assert {var.name for var in variables} == {"b", "c"}
+    assert [var.name for var in dr.iter_available_variables()] == [
+        var.name for var in dr.list_available_variables()
+    ]
+
+
 def test_driver_variables_filters_tags_error():
     dr = Driver({}, tests.resources.tagging)
     with pytest.raises(ValueError):
@@ -174,6 +196,9 @@ def test_driver_variables_filters_tags_error():
     with pytest.raises(ValueError):
         # empty list shouldn't be allowed
         dr.list_available_variables(tag_filter={"test": []})
+    with pytest.raises(ValueError):
+        # raised when called, not when iterated over
+        dr.iter_available_variables(tag_filter={"test": 1234})
 
 
 def test_driver_variables_external_input():
@@ -384,6 +409,14 @@ def test_capture_execute_telemetry_none_values(send_event_json, driver_factory):
             .with_config({"required": 1})
             .build()
         ),
+        (
+            lambda: Builder()
+            .enable_parallel_node_execution(max_workers=2)
+            .with_modules(tests.resources.test_default_args)
+            .with_adapter(base.DefaultAdapter())
+            .with_config({"required": 1})
+            .build()
+        ),
     ],
 )
 def test_node_is_required_by_anything(driver_factory):
@@ -426,6 +459,14 @@ def test_node_is_required_by_anything(driver_factory):
             .with_config({"required": 1})
             .build()
         ),
+        (
+            lambda: Builder()
+            .enable_parallel_node_execution(max_workers=2)
+            .with_modules(tests.resources.test_default_args)
+            .with_adapter(base.DefaultAdapter())
+            .with_config({"required": 1})
+            .build()
+        ),
     ],
 )
 def test_using_callables_to_execute(driver_factory):
@@ -478,6 +519,261 @@ def test_v2_driver_builder():
     assert list(dr.graph_modules) == [tests.resources.very_simple_dag]
 
 
+def test_parallel_driver_builder():
+    dr = (
+        Builder()
+        .enable_parallel_node_execution(max_workers=4)
+        .with_modules(tests.resources.very_simple_dag)
+        .build()
+    )
+    assert isinstance(dr.graph_executor, ParallelGraphExecutor)
+    assert dr.graph_executor.max_workers == 4
+    assert dr.execute(["b"], inputs={"a": 1}) == {"b": 1}
+
+
+def test_parallel_driver_reuses_plan_and_pool():
+    dr = (
+        Builder()
+        .enable_parallel_node_execution(max_workers=2)
+        .with_modules(tests.resources.very_simple_dag)
+        .build()
+    )
+    with mock.patch.object(
+        graph_functions,
+        "create_parallel_execution_plan",
+        wraps=graph_functions.create_parallel_execution_plan,
+    ) as create_plan:
+        assert dr.execute(["b"], inputs={"a": 1}) == {"b": 1}
+        pool = dr.graph_executor._pool
+        assert dr.execute(["b"], inputs={"a": 2}) == {"b": 2}
+        assert create_plan.call_count == 1
+        assert dr.graph_executor._pool is pool
+        dr.execute(["a", "b"], inputs={"a": 3})  # different request shape
+        assert create_plan.call_count == 2
+    dr.graph_executor.shutdown()
+    assert dr.graph_executor._pool is None
+    assert dr.execute(["b"], inputs={"a": 4}) == {"b": 4}
+
+
+def test_parallel_driver_pgo():
+    dr = (
+        Builder()
+        .enable_parallel_node_execution(max_workers=2, pgo=True, pgo_interval=2)
+        .with_modules(tests.resources.very_simple_dag)
+        .build()
+    )
+    executor = dr.graph_executor
+    assert executor.pgo_interval == 2
+    durations = iter([1.0, 2.0, 2.0])
+
+    def timed_execute(node_, kwargs, adapter, run_id):
+        result = graph_functions.execute_lifecycle_for_node(node_, kwargs, adapter, run_id)
+        return result, next(durations)
+
+    with mock.patch.object(
+        graph_functions,
+        "create_parallel_execution_plan",
+        wraps=graph_functions.create_parallel_execution_plan,
+    ) as create_plan, mock.patch.object(
+        graph_functions, "_timed_execute_lifecycle_for_node", timed_execute
+    ):
+        assert dr.execute(["b"], inputs={"a": 1}) == {"b": 1}
+        assert executor._node_timings == {"b": 1.0}
+        assert dr.execute(["b"], inputs={"a": 2}) == {"b": 2}
+        assert executor._node_timings["b"] == pytest.approx(1.1)  # moving average
+        assert create_plan.call_count == 1
+        # every `pgo_interval` executions the plan is recreated, with the measured costs
+        assert dr.execute(["b"], inputs={"a": 3}) == {"b": 3}
+        assert executor._node_timings["b"] == pytest.approx(1.19)
+        assert create_plan.call_count == 2
+    executor.shutdown()
+
+
+@pytest.mark.parametrize("cost_fn", [None, lambda node_: 2 if node_.name == "untimed" else 1])
+def test_parallel_executor_pgo_costs_untimed_nodes_in_seconds(cost_fn):
+    executor = ParallelGraphExecutor(pgo=True, cost_fn=cost_fn)
+    untimed = node.Node("untimed", int, node_source=node.NodeType.EXTERNAL)
+    assert executor._get_cost_fn() is cost_fn  # nothing measured yet
+    executor._record_timings({"fast": 1e-5, "slow": 3e-5})
+    estimate_cost = executor._get_cost_fn()
+    fast = node.Node("fast", int, node_source=node.NodeType.EXTERNAL)
+    assert estimate_cost(fast) == pytest.approx(1e-5)
+    # untimed nodes cost the mean timing (scaled by cost_fn), not cost_fn's raw units
+    expected = 2e-5 * (cost_fn(untimed) if cost_fn is not None else 1)
+    assert estimate_cost(untimed) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "driver_factory",
+    [
+        (lambda: Driver({}, tests.resources.very_simple_dag, adapter=base.DefaultAdapter())),
+        (
+            lambda: Builder()
+            .enable_parallel_node_execution(max_workers=2)
+            .with_modules(tests.resources.very_simple_dag)
+            .build()
+        ),
+    ],
+)
+def test_driver_execute_batch(driver_factory):
+    dr = driver_factory()
+    results = dr.execute_batch(["b"], inputs=[{"a": 1}, {"a": 2}, {"a": 3}])
+    assert results == [{"b": 1}, {"b": 2}, {"b": 3}]
+    assert dr.execute_batch(["b"], inputs=[]) == []
+
+
+def test_parallel_driver_builder_disjoint_with_dynamic_execution():
+    with pytest.raises(ValueError):
+        Builder().enable_parallel_node_execution().enable_dynamic_execution(
+            allow_experimental_mode=True
+        )
+    with pytest.raises(ValueError):
+        Builder().enable_dynamic_execution(
+            allow_experimental_mode=True
+        ).enable_parallel_node_execution()
+
+
+def test_driver_caches_upstream_nodes():
+    dr = Driver({"required": 1}, tests.resources.test_default_args)
+    with mock.patch.object(
+        dr.graph, "get_upstream_nodes", wraps=dr.graph.get_upstream_nodes
+    ) as get_upstream_nodes:
+        assert dr.execute(["C", "B"]) is not None
+        assert dr.execute(["B", "C"]) is not None  # order does not matter
+        assert get_upstream_nodes.call_count == 1
+        # different request shape -- this has to be traversed again
+        dr.execute(["C", "B"], inputs={"defaults_to_zero": 1})
+        assert get_upstream_nodes.call_count == 2
+        dr.execute(["C", "B"], inputs={"defaults_to_zero": 2})
+        assert get_upstream_nodes.call_count == 2
+
+
+def test_driver_caches_input_type_checks():
+    dr = Driver({}, tests.resources.test_default_args)
+    with mock.patch.object(
+        htypes, "check_input_type", wraps=htypes.check_input_type
+    ) as check_input_type:
+        # both inputs are (int, int), so they share a cache entry
+        dr.execute(["C"], inputs={"required": 1, "defaults_to_zero": 1})
+        assert check_input_type.call_count == 1
+        dr.execute(["C"], inputs={"required": 2, "defaults_to_zero": 2})
+        assert check_input_type.call_count == 1
+        with pytest.raises(ValueError):
+            dr.execute(["C"], inputs={"required": "2"})
+        assert check_input_type.call_count == 2
+
+
+class _CountingInputValidator(lifecycle_base.BaseDoValidateInput):
+    def __init__(self):
+        self.calls = 0
+
+    def do_validate_input(self, *, node_type: type, input_value: Any) -> bool:
+        self.calls += 1
+        return input_value > 0
+
+
+def test_driver_does_not_cache_non_cacheable_input_validation():
+    validator = _CountingInputValidator()
+    dr = Builder().with_modules(tests.resources.test_default_args).with_adapters(validator).build()
+    dr.execute(["C"], inputs={"required": 1})
+    dr.execute(["C"], inputs={"required": 2})
+    assert validator.calls == 2
+    with pytest.raises(ValueError):
+        dr.execute(["C"], inputs={"required": -1})
+
+
+class _ValueCheckingGraphAdapter(base.SimplePythonGraphAdapter):
+    @staticmethod
+    def check_input_type(node_type: type, input_value: Any) -> bool:
+        return input_value > 0
+
+
+def test_driver_does_not_cache_input_validation_overridden_by_subclass():
+    dr = Driver({}, tests.resources.test_default_args, adapter=_ValueCheckingGraphAdapter())
+    dr.execute(["C"], inputs={"required": 1})
+    with pytest.raises(ValueError):
+        dr.execute(["C"], inputs={"required": -5})
+
+
+def test_driver_returns_requested_inputs_without_executing():
+    dr = Driver({"required": 1}, tests.resources.test_default_args, adapter=base.DefaultAdapter())
+    with mock.patch.object(dr.graph_executor, "execute") as execute:
+        assert dr.execute(["required", "defaults_to_zero"], inputs={"defaults_to_zero": 2}) == {
+            "required": 1,
+            "defaults_to_zero": 2,
+        }
+        execute.assert_not_called()
+        with pytest.raises(ValueError):
+            # inputs are still validated
+            dr.execute(["defaults_to_zero"], inputs={"defaults_to_zero": "2"})
+        execute.assert_not_called()
+    # anything that has to be computed still goes through the executor
+    assert dr.execute(["A", "required"]) == {"A": 1, "required": 1}
+
+
+def test_driver_display_graph_warns_once():
+    _warn_display_graph_deprecated.cache_clear()
+    dr = Driver({"a": 1}, tests.resources.very_simple_dag, adapter=base.DefaultAdapter())
+    with mock.patch.object(
+        Driver, "_visualize_execution_helper"
+    ) as visualize_execution, mock.patch.object(
+        dr.graph, "get_upstream_nodes", wraps=dr.graph.get_upstream_nodes
+    ) as get_upstream_nodes:
+        with pytest.warns(DeprecationWarning):
+            assert dr.execute(["b"], display_graph=True) == {"b": 1}
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert dr.execute(["b"], display_graph=True) == {"b": 1}
+    assert visualize_execution.call_count == 2
+    # the visualization reuses the nodes computed (and validated) for execution
+    assert get_upstream_nodes.call_count == 1  # the second execute is cached
+    for call in visualize_execution.call_args_list:
+        assert call.kwargs["bypass_validation"]
+        nodes, user_nodes = call.kwargs["upstream_nodes"]
+        assert {n.name for n in nodes | user_nodes} == {"a", "b"}
+
+
+def test_driver_compile_plan():
+    dr = (
+        Builder()
+        .with_modules(tests.resources.test_default_args)
+        .with_config({"required": 1})
+        .build()
+    )
+    plan = dr.compile_plan(["B", "defaults_to_zero"])
+    assert plan({}) == dr.execute(["B", "defaults_to_zero"]) == {"B": 1, "defaults_to_zero": None}
+    assert plan({"defaults_to_zero": 3}) == dr.execute(
+        ["B", "defaults_to_zero"], inputs={"defaults_to_zero": 3}
+    )
+    assert dr.compile_plan(["B", "defaults_to_zero"]) is plan
+    for run in (plan, lambda inputs: dr.execute(["B", "defaults_to_zero"], inputs=inputs)):
+        with pytest.raises(ValueError, match="mutually disjoint"):
+            run({"required": 100})
+    with pytest.raises(ValueError):
+        # D requires it
+        dr.compile_plan(["D"])({})
+
+
+def test_driver_compile_plan_legacy_adapter():
+    dr = Driver({"required": 1}, tests.resources.test_default_args, adapter=base.DefaultAdapter())
+    assert dr.compile_plan(["C"])({}) == {"C": 2}
+
+
+def test_driver_compile_plan_rejects_execution_hooks():
+    class PreNodeExecute(lifecycle_base.BasePreNodeExecute):
+        def pre_node_execute(self, **kwargs):
+            pass
+
+    dr = (
+        Builder()
+        .with_modules(tests.resources.test_default_args)
+        .with_adapters(PreNodeExecute())
+        .build()
+    )
+    with pytest.raises(ValueError):
+        dr.compile_plan(["B"])
+
+
 def test_executor_validates_happy_default_executor():
     dr = Driver({}, tests.resources.very_simple_dag)
     nodes, user_nodes = dr.graph.get_upstream_nodes(["b"])